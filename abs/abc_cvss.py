@@ -1,7 +1,11 @@
 from enum import Enum
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Self
+from dataclasses import dataclass, field, fields, MISSING
+from functools import lru_cache
+from typing import ClassVar, Self
+
+from abs.exceptions import InvalidMetricValueError, InvalidScoreError, InvalidVectorStringError, \
+    InvalidVersionError, MissingMetricError
 
 
 class AbcVector(Enum):
@@ -16,7 +20,7 @@ class AbcVector(Enum):
         for elem in cls:
             if elem.value[0] == value:
                 return cls(elem)
-        raise  # todo create exception
+        cls._raise_invalid(value)
 
     @classmethod
     def from_char(cls, value: str) -> Self:
@@ -28,7 +32,13 @@ class AbcVector(Enum):
         for elem in cls:
             if elem.value[1] == value:
                 return cls(elem)
-        raise  # todo create exception
+        cls._raise_invalid(value)
+
+    @classmethod
+    def _raise_invalid(cls, value: str | None):
+        if value is None:
+            raise MissingMetricError(f'Missing metric {cls.__name__}')
+        raise InvalidMetricValueError(f'Invalid value {value!r} for metric {cls.__name__}')
 
     def to_str(self, vector_initial: str) -> str:
         return f'{vector_initial}:{self.value[1]}/'
@@ -52,7 +62,7 @@ class CvssSeverity(Enum):
     @classmethod
     def from_float(cls, value: float) -> Self:
         if value == 0.0:
-            return cls('None')
+            return cls('NONE')
         elif 0.1 <= value <= 3.9:
             return cls('LOW')
         elif 4.0 <= value <= 6.9:
@@ -62,7 +72,7 @@ class CvssSeverity(Enum):
         elif 9.0 <= value <= 10.0:
             return cls('CRITICAL')
         else:
-            raise  # todo create exception
+            raise InvalidScoreError(f'Invalid score {value}')
 
     def __str__(self) -> str:
         return self.value
@@ -82,19 +92,99 @@ class CvssVersion(Enum):
         for elem in cls:
             if elem.value == version:
                 return cls(elem)
-        raise  # todo create exception
+        raise InvalidVersionError(f'Invalid CVSS version {version!r}')
 
     def __str__(self) -> str:
         return self.value
 
 
+_VERSIONS = tuple(CvssVersion)
+
+
+@dataclass(frozen=True)
+class MetricField:
+    """
+    Position of one metric inside the packed integer of a CVSS class.
+    The code of a metric is the index of its member in the enum definition order.
+    key is the abbreviation of the metric in vector strings and group is 'base', 'temporal' or 'environmental'.
+    """
+    name: str
+    enum: type[AbcVector]
+    members: tuple[AbcVector, ...]
+    shift: int
+    width: int
+    is_base: bool
+    default: AbcVector | None
+    key: str | None
+    group: str
+
+    @property
+    def mask(self) -> int:
+        return (1 << self.width) - 1
+
+    def code_of(self, member: AbcVector) -> int:
+        return self.members.index(member)
+
+
+@lru_cache(maxsize=None)
+def _metric_layout(cls: type) -> tuple[MetricField, ...]:
+    layout = []
+    shift = 0
+    vector_keys = getattr(cls, 'VECTOR_KEYS', {})
+    temporal_fields = getattr(cls, 'TEMPORAL_FIELDS', ())
+    for f in fields(cls):
+        if not (isinstance(f.type, type) and issubclass(f.type, AbcVector)):
+            continue
+        members = tuple(f.type)
+        width = max(1, (len(members) - 1).bit_length())
+        if f.default is MISSING:
+            group = 'base'
+        elif f.name in temporal_fields:
+            group = 'temporal'
+        else:
+            group = 'environmental'
+        layout.append(MetricField(name=f.name,
+                                  enum=f.type,
+                                  members=members,
+                                  shift=shift,
+                                  width=width,
+                                  is_base=f.default is MISSING,
+                                  default=None if f.default is MISSING else f.default,
+                                  key=vector_keys.get(f.name),
+                                  group=group))
+        shift += width
+    return tuple(layout)
+
+
+@lru_cache(maxsize=65536)
+def _decoded_state(cls: type, version_tag: int, code: int) -> dict:
+    return dict(vars(cls.from_packed(code, _VERSIONS[version_tag])))
+
+
+def _restore_cvss(cls: type, version_tag: int, code: int, overrides: dict | None = None):
+    """
+    Unpickle target of AbcCvss.__reduce__. The state of each distinct (class, version, code) is computed once per
+    process, so restoring an object neither parses a vector string nor computes the scores again. overrides holds
+    the attributes set on the pickled object that differ from that state, e.g. with set_base_score.
+    """
+    cvss = object.__new__(cls)
+    cvss.__dict__.update(_decoded_state(cls, version_tag, code))
+    if overrides:
+        cvss.__dict__.update(overrides)
+    return cvss
+
+
 @dataclass
 class AbcCvss(ABC):
+    VECTOR_KEYS: ClassVar[dict[str, str]] = {}
+    TEMPORAL_FIELDS: ClassVar[tuple[str, ...]] = ()
+    PRIMITIVE_KEYS: ClassVar[dict[str, str]] = {}
 
     version: CvssVersion
     _vector_string: str | None = field(init=False, default=None)
     _base_severity: CvssSeverity = field(init=False, default=None)
     _base_score: float = field(init=False, default=None)
+    _temporal_score: float = field(init=False, default=None)
     _env_score: float = field(init=False, default=None)
 
     @classmethod
@@ -107,6 +197,47 @@ class AbcCvss(ABC):
     def from_vector_string(cls, value: str):
         pass
 
+    @classmethod
+    def metric_layout(cls) -> tuple[MetricField, ...]:
+        """
+        Metric fields of the class in declaration order, with their bit position in the packed integer.
+        """
+        return _metric_layout(cls)
+
+    @classmethod
+    def from_packed(cls, code: int, version: CvssVersion) -> Self:
+        """
+        Constructor with the packed metric integer returned by to_packed.
+        :param code:
+        :param version:
+        :return:
+        """
+        metrics = {}
+        for metric in cls.metric_layout():
+            index = (code >> metric.shift) & metric.mask
+            if index >= len(metric.members):
+                raise ValueError(f'Invalid code {index} for metric {metric.name}')
+            metrics[metric.name] = metric.members[index]
+        return cls(version=version, **metrics)
+
+    def to_packed(self) -> int:
+        """
+        Pack every metric of the object in a single integer, see metric_layout.
+        :return: int
+        """
+        code = 0
+        for metric in self.metric_layout():
+            code |= metric.code_of(getattr(self, metric.name)) << metric.shift
+        return code
+
+    def __reduce__(self):
+        version_tag, code = _VERSIONS.index(self.version), self.to_packed()
+        state = _decoded_state(type(self), version_tag, code)
+        overrides = {name: value for name, value in vars(self).items() if name not in state or state[name] != value}
+        if overrides:
+            return _restore_cvss, (type(self), version_tag, code, overrides)
+        return _restore_cvss, (type(self), version_tag, code)
+
     def set_base_score(self, value: float) -> None:
         """
         Set the attribute base_score safely.
@@ -114,20 +245,17 @@ class AbcCvss(ABC):
         :return: None
         """
         if not 0 <= value <= 10:
-            try:
-                self._compute_base_score()
-            except Exception as e:
-                raise Exception
-            finally:
-                return None
+            value = self._compute_base_score()
+            if not 0 <= value <= 10:
+                raise InvalidScoreError(f'Invalid base score {value}')
         self._base_score = value
         return None
 
     def set_base_severity(self, value: float) -> None:
-        try:
-            self._base_severity = CvssSeverity.from_float(value)
-        except Exception as e:
-            raise Exception
+        self._base_severity = CvssSeverity.from_float(value)
+
+    def set_temporal_score(self, value: float) -> None:
+        self._temporal_score = value
 
     def set_env_score(self, value: float) -> None:
         self._env_score = value
@@ -145,9 +273,26 @@ class AbcCvss(ABC):
     def get_base_severity(self) -> CvssSeverity:
         return self._base_severity
 
+    def get_temporal_score(self) -> float:
+        return self._temporal_score
+
     def get_env_score(self) -> float:
         return self._env_score
 
+    def get_exploitability_score(self) -> float:
+        """
+        Exploitability sub score, rounded to one decimal like the exploitabilityScore of the NVD.
+        :return: float
+        """
+        return round(float(self._compute_exploitability_score()), 1)
+
+    def get_impact_score(self) -> float:
+        """
+        Impact sub score, rounded to one decimal like the impactScore of the NVD.
+        :return: float
+        """
+        return round(float(self._compute_impact_score()), 1)
+
     @abstractmethod
     def _compute_base_score(self) -> float:
         """
@@ -156,6 +301,10 @@ class AbcCvss(ABC):
         """
         pass
 
+    @abstractmethod
+    def _compute_temporal_score(self) -> float:
+        pass
+
     @abstractmethod
     def _compute_env_score(self) -> float:
         pass
@@ -168,20 +317,52 @@ class AbcCvss(ABC):
     def _compute_impact_score(self) -> float:
         pass
 
+    @classmethod
+    def check_vector_string(cls, vector_string: str) -> None:
+        """
+        Check the shape of a vector string before its metrics are parsed, see from_vector_string. Nothing is
+        checked by default.
+        :param vector_string:
+        :return: None
+        :raise InvalidVectorStringError:
+        """
+        pass
+
     @staticmethod
-    def parse_vector_string(vector_string: str) -> dict[str, str]:
+    def as_vector_str(vector_string: str | bytes | bytearray | memoryview) -> str:
+        """
+        Return vector_string as a str, bytes-like values (bytes, bytearray, memoryview, mmap slices) are decoded
+        as ASCII.
+        :param vector_string:
+        :return: str
+        """
+        if isinstance(vector_string, str):
+            return vector_string
+        try:
+            return str(vector_string, 'ascii')
+        except UnicodeDecodeError:
+            raise InvalidVectorStringError('Vector string is not ASCII') from None
+        except TypeError:
+            raise InvalidVectorStringError(f'Expected a vector string, got {type(vector_string).__name__}') from None
+
+    @staticmethod
+    def parse_vector_string(vector_string: str | bytes | bytearray | memoryview) -> dict[str, str]:
         """
         Parse a vector string and return a dictionnaire of metrics.
         Example: this method transform
         this str "AV:N/AC:L/Au:N/C:N/I:N/A:P"
         to this dict {'AV': 'N', 'AC': 'L', 'Au': 'N', 'C': 'N', 'I': 'N', 'A': 'P'}
 
-        :param vector_string:
+        :param vector_string: A str or a bytes-like object
         :return: dict
         """
+        vector_string = AbcCvss.as_vector_str(vector_string)
         result = {}
         pairs = vector_string.split("/")
         for pair in pairs:
-            key, value = pair.split(":")
+            try:
+                key, value = pair.split(":")
+            except ValueError:
+                raise InvalidVectorStringError(f'Invalid metric {pair!r} in vector string') from None
             result[key] = value
         return result
@@ -0,0 +1,53 @@
+class CvssError(ValueError):
+    """
+    Base class of the errors raised when building a CVSS object.
+    code identifies the error class in the error arrays of the bulk constructors, 0 meaning no error.
+    """
+    code = 1
+
+
+class InvalidVectorStringError(CvssError):
+    """
+    The vector string is not made of "key:value" pairs separated by "/", or does not match its version.
+    """
+    code = 2
+
+
+class MissingMetricError(CvssError):
+    """
+    A base metric is missing.
+    """
+    code = 3
+
+
+class InvalidMetricValueError(CvssError):
+    """
+    A metric has a value unknown to its enum.
+    """
+    code = 4
+
+
+class InvalidVersionError(CvssError):
+    """
+    The CVSS version is missing or unknown.
+    """
+    code = 5
+
+
+class InvalidScoreError(CvssError):
+    """
+    A score is not between 0 and 10.
+    """
+    code = 6
+
+
+class InvalidRecordError(CvssError):
+    """
+    A primitive dict, as read from the NVD, is missing a field or has an unexpected structure.
+    """
+    code = 7
+
+
+ERRORS: tuple[type[CvssError], ...] = (CvssError, InvalidVectorStringError, MissingMetricError,
+                                       InvalidMetricValueError, InvalidVersionError, InvalidScoreError,
+                                       InvalidRecordError)
@@ -0,0 +1,112 @@
+import gc
+import sys
+import tracemalloc
+from typing import Callable
+
+import numpy as np
+
+from cvss.codec import dumps_batch
+from cvss.corpus import CvssCorpus
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v30 import CvssV30
+from cvss.cvss_v31 import CvssV31
+from cvss.intern_table import VectorInternTable
+from cvss.nvd_writer import nvd_metric
+
+VECTORS_V2 = ["AV:N/AC:L/Au:N/C:N/I:N/A:P", "AV:N/AC:M/Au:S/C:C/I:C/A:C", "AV:L/AC:H/Au:M/C:P/I:P/A:P/E:F"]
+VECTORS_V30 = ["CVSS:3.0/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H", "CVSS:3.0/AV:L/AC:H/PR:L/UI:R/S:U/C:L/I:L/A:N"]
+VECTORS_V31 = ["CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H",
+               "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H/MAV:P",
+               "CVSS:3.1/AV:L/AC:H/PR:L/UI:R/S:U/C:L/I:L/A:N/E:P/RL:O/RC:C"]
+
+# Maximum bytes per row, the check fails when a measure is above its budget.
+BUDGETS = {
+    'CvssV2 instance': 450,
+    'CvssV3.0 instance': 700,
+    'CvssV31 instance': 700,
+    'packed int': 48,
+    'packed numpy': 9,
+    'CvssCorpus columns': 48,
+    'intern table ids': 10,
+    'dumps_batch': 12,
+    'from_primitive_dict peak': 700,
+}
+
+
+def _measure(build: Callable[[], object], size: int) -> tuple[float, float]:
+    """
+    Memory kept by the object returned by build and peak memory during build, in bytes per row.
+    build is called once before measuring, so that the caches filled on first use (layouts, score tables,
+    compiled profiles) are not counted in the rows.
+    """
+    build()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return (current - before) / size, (peak - before) / size
+
+
+def _rows(vectors: list[str], size: int) -> list[str]:
+    return [vectors[i % len(vectors)] for i in range(size)]
+
+
+def measure(size: int = 20_000) -> dict[str, float]:
+    """
+    Bytes per row of every representation of a corpus of size rows.
+    :param size:
+    :return: dict
+    """
+    rows_v2 = _rows(VECTORS_V2, size)
+    rows_v30 = _rows(VECTORS_V30, size)
+    rows_v31 = _rows(VECTORS_V31, size)
+    ids = [f'CVE-2024-{i:07}' for i in range(size)]
+    objects = [CvssV31.from_vector_string(v) for v in rows_v31]
+    codes = [cvss.to_packed() for cvss in objects]
+    primitive_dicts = [[nvd_metric(CvssV31.from_vector_string(v))] for v in VECTORS_V31]
+    primitive_rows = [primitive_dicts[i % len(primitive_dicts)] for i in range(size)]
+
+    def intern_ids():
+        table = VectorInternTable()
+        return table, table.encode(objects)
+
+    results = {
+        'CvssV2 instance': _measure(lambda: [CvssV2.from_vector_string(v) for v in rows_v2], size)[0],
+        'CvssV3.0 instance': _measure(lambda: [CvssV30.from_vector_string(v) for v in rows_v30], size)[0],
+        'CvssV31 instance': _measure(lambda: [CvssV31.from_vector_string(v) for v in rows_v31], size)[0],
+        'packed int': _measure(lambda: [cvss.to_packed() for cvss in objects], size)[0],
+        'packed numpy': _measure(lambda: np.array(codes, dtype=np.uint64), size)[0],
+        'CvssCorpus columns': _measure(lambda: CvssCorpus.from_codes(CvssV31, objects[0].version, ids, codes),
+                                       size)[0],
+        'intern table ids': _measure(intern_ids, size)[0],
+        'dumps_batch': _measure(lambda: dumps_batch(objects), size)[0],
+        'from_primitive_dict peak': _measure(lambda: [CvssV31.from_primitive_dict(d) for d in primitive_rows],
+                                             size)[1],
+    }
+    return results
+
+
+def check_budgets(results: dict[str, float], budgets: dict[str, float] | None = None) -> list[str]:
+    """
+    :return: The measures above their budget, empty when every budget is respected
+    """
+    budgets = BUDGETS if budgets is None else budgets
+    return [f'{name}: {results[name]:.1f} bytes/row > {budget}'
+            for name, budget in budgets.items() if name in results and results[name] > budget]
+
+
+def run(size: int = 20_000) -> int:
+    results = measure(size)
+    for name, per_row in results.items():
+        print(f'{name:<26} {per_row:10.1f} bytes/row {per_row * 1e6 / 2 ** 20:10.1f} MiB per 1M rows')
+    violations = check_budgets(results)
+    for violation in violations:
+        print(f'OVER BUDGET {violation}')
+    return 1 if violations else 0
+
+
+if __name__ == '__main__':
+    sys.exit(run())
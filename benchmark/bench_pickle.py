@@ -0,0 +1,44 @@
+import pickle
+import time
+
+from cvss.codec import dumps_batch, loads_batch
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v31 import CvssV31
+
+VECTORS_V2 = ["AV:N/AC:L/Au:N/C:N/I:N/A:P", "AV:N/AC:M/Au:S/C:C/I:C/A:C", "AV:L/AC:H/Au:M/C:P/I:P/A:P"]
+VECTORS_V31 = ["CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H",
+               "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H/MAV:P",
+               "CVSS:3.1/AV:L/AC:H/PR:L/UI:R/S:U/C:L/I:L/A:N/E:P/RL:O/RC:C"]
+
+
+def _corpus(size: int) -> list:
+    # One instance per row, as a real corpus would hold, so pickle cannot memoize whole objects.
+    builders = [(CvssV2, v) for v in VECTORS_V2] + [(CvssV31, v) for v in VECTORS_V31]
+    return [cls.from_vector_string(v) for cls, v in (builders[i % len(builders)] for i in range(size))]
+
+
+def _default_pickle(objects: list) -> bytes:
+    # What the plain dataclass pickling produced: the class plus the full instance dict.
+    return pickle.dumps([(type(o), vars(o)) for o in objects], protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _measure(name: str, dumps, loads, objects: list) -> None:
+    start = time.perf_counter()
+    data = dumps(objects)
+    middle = time.perf_counter()
+    loads(data)
+    end = time.perf_counter()
+    print(f'{name:<16} {len(data) / len(objects):8.1f} bytes/object  '
+          f'dumps {(middle - start) * 1e6 / len(objects):6.2f} us/object  '
+          f'loads {(end - middle) * 1e6 / len(objects):6.2f} us/object')
+
+
+def run(size: int = 20_000) -> None:
+    objects = _corpus(size)
+    _measure('dataclass state', _default_pickle, pickle.loads, objects)
+    _measure('pickle', lambda o: pickle.dumps(o, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads, objects)
+    _measure('batch', dumps_batch, loads_batch, objects)
+
+
+if __name__ == '__main__':
+    run()
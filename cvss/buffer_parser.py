@@ -0,0 +1,144 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss, _VERSIONS
+from abs.exceptions import CvssError
+from cvss.codec import score_codes
+
+_HASH_BASE = 0x100000001B3
+_HASH_BASE_INVERSE = pow(_HASH_BASE, -1, 2 ** 64)
+_NEWLINE = ord('\n')
+
+
+@lru_cache(maxsize=4)
+def _powers(length: int) -> tuple[np.ndarray, np.ndarray]:
+    powers = np.full(length, _HASH_BASE, dtype=np.uint64)
+    powers[0] = 1
+    inverses = np.full(length, _HASH_BASE_INVERSE, dtype=np.uint64)
+    inverses[0] = 1
+    return np.cumprod(powers, dtype=np.uint64), np.cumprod(inverses, dtype=np.uint64)
+
+
+@dataclass
+class ParsedBuffer:
+    """
+    One row per line of the buffer: the packed code of the vector, the index of its version in CvssVersion and
+    whether the line is a valid vector string. Code and version are 0 on invalid lines.
+    """
+    codes: np.ndarray
+    version_tags: np.ndarray
+    valid: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class VectorBufferParser:
+    """
+    Parse newline-delimited vector strings directly from a bytes-like buffer: bytes, bytearray, memoryview or mmap.
+    Lines are grouped by a 64 bits polynomial hash computed with NumPy over the raw buffer, and compared with the
+    first line of their group, so only the first occurrence of each distinct line of a chunk is copied, every other
+    line costs no Python object at all. A line whose hash collides with another line is handled on its own.
+    The parser keeps the parsed lines by their bytes, reuse the same parser for the successive buffers of a job.
+    """
+
+    def __init__(self, cls: type[AbcCvss], chunk_size: int = 1 << 20):
+        self.cls = cls
+        self.chunk_size = chunk_size
+        self._parsed: dict[bytes, tuple[int, int, bool]] = {}
+
+    def parse_one(self, value: str | bytes | bytearray | memoryview) -> tuple[int, int, bool]:
+        """
+        Parse a single vector string.
+        :param value:
+        :return: (packed code, version tag, valid)
+        """
+        try:
+            cvss = self.cls.from_vector_string(AbcCvss.as_vector_str(value).strip())
+        except CvssError:
+            return 0, 0, False
+        return cvss.to_packed(), _VERSIONS.index(cvss.version), True
+
+    def parse_buffer(self, buffer) -> ParsedBuffer:
+        """
+        Parse every line of buffer. A final newline does not start an empty line.
+        :param buffer: bytes, bytearray, memoryview or mmap
+        :return: ParsedBuffer
+        """
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        codes, tags, valid = [], [], []
+        start = 0
+        while start < len(data):
+            end = min(start + self.chunk_size, len(data))
+            if end < len(data):
+                newlines = np.flatnonzero(data[start:end] == _NEWLINE)
+                if len(newlines):
+                    end = start + int(newlines[-1]) + 1
+                else:
+                    following = np.flatnonzero(data[end:] == _NEWLINE)
+                    end = end + int(following[0]) + 1 if len(following) else len(data)
+            chunk_codes, chunk_tags, chunk_valid = self._parse_chunk(data[start:end])
+            codes.append(chunk_codes)
+            tags.append(chunk_tags)
+            valid.append(chunk_valid)
+            start = end
+        if not codes:
+            return ParsedBuffer(np.empty(0, np.uint64), np.empty(0, np.uint8), np.empty(0, bool))
+        return ParsedBuffer(np.concatenate(codes), np.concatenate(tags), np.concatenate(valid))
+
+    def _parse_chunk(self, chunk: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        newlines = np.flatnonzero(chunk == _NEWLINE)
+        ends = newlines if len(newlines) and newlines[-1] == len(chunk) - 1 else np.append(newlines, len(chunk))
+        starts = np.concatenate(([0], ends[:-1] + 1))
+
+        _, first, inverse = np.unique(self._hashes(chunk, starts, ends), return_index=True, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        collisions = np.flatnonzero(self._differs(chunk, starts, first[inverse], ends - starts))
+        lines = np.concatenate((first, collisions))
+        table = np.empty(len(lines), dtype=[('code', np.uint64), ('tag', np.uint8), ('valid', bool)])
+        for row, line in enumerate(lines.tolist()):
+            table[row] = self._parse_line(chunk[starts[line]:ends[line]].tobytes())
+        inverse[collisions] = np.arange(len(first), len(lines))
+        rows = table[inverse]
+        return rows['code'], rows['tag'], rows['valid']
+
+    def _parse_line(self, line: bytes) -> tuple[int, int, bool]:
+        parsed = self._parsed.get(line)
+        if parsed is None:
+            parsed = self._parsed[line] = self.parse_one(line)
+        return parsed
+
+    def _hashes(self, chunk: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        powers, inverses = _powers(max(self.chunk_size, len(chunk)) + 1)
+        prefix = np.zeros(len(chunk) + 1, dtype=np.uint64)
+        np.cumsum((chunk.astype(np.uint64) + np.uint64(1)) * powers[:len(chunk)], dtype=np.uint64, out=prefix[1:])
+        return (prefix[ends] - prefix[starts]) * inverses[starts] + (ends - starts).astype(np.uint64)
+
+    @staticmethod
+    def _differs(chunk: np.ndarray, starts: np.ndarray, references: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """
+        Whether each line differs from its reference line, the first line with the same hash.
+        """
+        differs = lengths != lengths[references]
+        for length in np.unique(lengths).tolist():
+            rows = np.flatnonzero((lengths == length) & ~differs)
+            if length == 0 or not len(rows):
+                continue
+            windows = np.lib.stride_tricks.sliding_window_view(chunk, length)
+            differs[rows] = (windows[starts[rows]] != windows[starts[references[rows]]]).any(axis=1)
+        return differs
+
+    def score_buffer(self, buffer) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Parse and score every line of buffer.
+        :param buffer: bytes, bytearray, memoryview or mmap
+        :return: (base scores, temporal scores, environmental scores), nan on invalid lines
+        """
+        parsed = self.parse_buffer(buffer)
+        scores = np.full((3, len(parsed)), np.nan)
+        for tag in np.unique(parsed.version_tags[parsed.valid]).tolist():
+            rows = parsed.valid & (parsed.version_tags == tag)
+            scores[:, rows] = score_codes(self.cls, _VERSIONS[tag], parsed.codes[rows])
+        return scores[0], scores[1], scores[2]
@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss
+from abs.exceptions import ERRORS, CvssError, InvalidRecordError, InvalidVectorStringError
+from cvss.dispatch import parse_any
+
+# Name of the error class of every error code, 0 meaning no error.
+ERROR_NAMES: tuple[str, ...] = ('',) + tuple(error.__name__ for error in ERRORS)
+
+
+@dataclass
+class BulkResult:
+    """
+    Objects built from a batch of rows. A row that could not be built has no object, a non zero error code, see
+    abs.exceptions, and the index of its error message in messages.
+    """
+    objects: list[AbcCvss | None]
+    error_codes: np.ndarray
+    message_ids: np.ndarray
+    messages: list[str]
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def failed_rows(self) -> np.ndarray:
+        return np.flatnonzero(self.error_codes)
+
+    def message(self, row: int) -> str | None:
+        message_id = int(self.message_ids[row])
+        return None if message_id < 0 else self.messages[message_id]
+
+
+class _BulkBuilder:
+    """
+    Accumulate the rows of a BulkResult, with one entry per distinct error message.
+    """
+
+    def __init__(self):
+        self.objects: list[AbcCvss | None] = []
+        self.error_codes: list[int] = []
+        self.message_ids: list[int] = []
+        self._messages: dict[str, int] = {}
+
+    def build(self, constructor: Callable[[], AbcCvss], unexpected: type[CvssError]) -> tuple:
+        """
+        Call constructor, errors of the record structure (KeyError, IndexError, TypeError) are reported as
+        unexpected.
+        :return: (object or None, error code, message id)
+        """
+        try:
+            return constructor(), 0, -1
+        except CvssError as e:
+            error = e
+        except (KeyError, IndexError, TypeError) as e:
+            error = unexpected(f'{type(e).__name__}: {e}')
+        message_id = self._messages.setdefault(str(error), len(self._messages))
+        return None, error.code, message_id
+
+    def append(self, row: tuple) -> None:
+        cvss, error_code, message_id = row
+        self.objects.append(cvss)
+        self.error_codes.append(error_code)
+        self.message_ids.append(message_id)
+
+    def result(self) -> BulkResult:
+        return BulkResult(self.objects, np.array(self.error_codes, dtype=np.uint8),
+                          np.array(self.message_ids, dtype=np.int32), list(self._messages))
+
+
+def bulk_from_vector_strings(values: Iterable[str], cls: type[AbcCvss] | None = None) -> BulkResult:
+    """
+    Build an object per vector string without raising: a malformed row only gets an error code.
+    Each distinct vector string is parsed once, its object is shared by its rows.
+    :param values:
+    :param cls: The CVSS class used to parse the vector strings, by default it is detected for each row
+    :return: BulkResult
+    """
+    parse = parse_any if cls is None else cls.from_vector_string
+    builder = _BulkBuilder()
+    parsed: dict = {}
+    for value in values:
+        # Only str and bytes rows are cached, other rows (bytearray, or values which are not vector strings and
+        # may not be hashable) are built each time.
+        if not isinstance(value, (str, bytes)):
+            builder.append(builder.build(lambda: parse(value), InvalidVectorStringError))
+            continue
+        row = parsed.get(value)
+        if row is None:
+            row = parsed[value] = builder.build(lambda: parse(value), InvalidVectorStringError)
+        builder.append(row)
+    return builder.result()
+
+
+def bulk_from_primitive_dicts(values: Iterable[dict | list], cls: type[AbcCvss] | None = None) -> BulkResult:
+    """
+    Build an object per NVD record without raising: a malformed record only gets an error code.
+    :param values: Arguments of from_primitive_dict, or NVD records when cls is None, see parse_any
+    :param cls:
+    :return: BulkResult
+    """
+    parse = parse_any if cls is None else cls.from_primitive_dict
+    builder = _BulkBuilder()
+    for value in values:
+        builder.append(builder.build(lambda: parse(value), InvalidRecordError))
+    return builder.result()
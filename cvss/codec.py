@@ -0,0 +1,97 @@
+import pickle
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss, CvssVersion, _VERSIONS, _restore_cvss
+from cvss.cvss_v3 import CvssV3
+from cvss.env_profile import EnvironmentalProfile, compile_profile
+from cvss.score_tables import get_score_table
+
+BATCH_FORMAT_VERSION = 1
+# Number of distinct codes sharing an environmental profile from which they are scored with the CompiledProfile of
+# the profile: compiling a profile costs about as much as scoring a thousand objects.
+COMPILE_THRESHOLD = 1024
+
+
+def dumps_batch(objects: list[AbcCvss]) -> bytes:
+    """
+    Serialize a list of CVSS objects as one tag array and one packed code array.
+    Each distinct (class, version) pair is written once in the header, so a row costs one tag byte plus its code.
+    :param objects:
+    :return: bytes
+    """
+    kinds: dict[tuple[type, int], int] = {}
+    tags = np.empty(len(objects), dtype=np.uint8)
+    codes = np.empty(len(objects), dtype=np.uint64)
+    for row, cvss in enumerate(objects):
+        kind = (type(cvss), _VERSIONS.index(cvss.version))
+        tags[row] = kinds.setdefault(kind, len(kinds))
+        codes[row] = cvss.to_packed()
+    if len(codes) and int(codes.max()) < 2 ** 32:
+        codes = codes.astype(np.uint32)
+    return pickle.dumps((BATCH_FORMAT_VERSION, tuple(kinds), codes.dtype.str, tags.tobytes(), codes.tobytes()),
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def loads_batch(data: bytes) -> list[AbcCvss]:
+    """
+    Rebuild the list serialized by dumps_batch.
+    :param data:
+    :return: list
+    """
+    format_version, kinds, dtype, tags, codes = pickle.loads(data)
+    if format_version != BATCH_FORMAT_VERSION:
+        raise ValueError(f'Unsupported batch format {format_version}')
+    tags = np.frombuffer(tags, dtype=np.uint8).tolist()
+    codes = np.frombuffer(codes, dtype=np.dtype(dtype)).tolist()
+    return [_restore_cvss(*kinds[tag], code) for tag, code in zip(tags, codes)]
+
+
+def _check_codes(cls: type[AbcCvss], codes: np.ndarray) -> None:
+    for metric in cls.metric_layout():
+        if (((codes >> np.uint64(metric.shift)) & np.uint64(metric.mask)) >= len(metric.members)).any():
+            raise ValueError(f'Invalid code for metric {metric.name}')
+
+
+def _env_scores(cls: type[AbcCvss], version: CvssVersion, codes: np.ndarray) -> np.ndarray:
+    """
+    Environmental scores of distinct packed codes, nan for classes without one. The codes are grouped by
+    environmental profile, large groups are looked up in the CompiledProfile of their profile.
+    """
+    if not issubclass(cls, CvssV3):
+        return np.full(len(codes), np.nan)
+    mask = sum(metric.mask << metric.shift for metric in cls.metric_layout() if metric.group == 'environmental')
+    profiles, groups = np.unique(codes & np.uint64(mask), return_inverse=True)
+    groups = groups.reshape(-1)
+    order = np.argsort(groups, kind='stable')
+    bounds = np.searchsorted(groups[order], np.arange(len(profiles) + 1))
+    env = np.empty(len(codes))
+    for group, profile_code in enumerate(profiles.tolist()):
+        rows = order[bounds[group]:bounds[group + 1]]
+        if len(rows) >= COMPILE_THRESHOLD:
+            profile = EnvironmentalProfile.from_cvss(cls.from_packed(profile_code, version))
+            env[rows] = compile_profile(cls, version, profile).score_codes(codes[rows])
+        else:
+            env[rows] = [cls.from_packed(code, version).get_env_score() for code in codes[rows].tolist()]
+    return env
+
+
+def score_codes(cls: type[AbcCvss], version: CvssVersion,
+                codes: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Base, temporal and environmental scores of packed codes. The base and temporal scores are looked up in the
+    score tables, see get_score_table, the environmental scores in compiled profiles, see CompiledProfile, except
+    for the distinct codes of rare profiles which are scored one by one.
+    :param cls:
+    :param version:
+    :param codes:
+    :return: (base scores, temporal scores, environmental scores), the environmental score is nan for classes
+    without one
+    :raise ValueError: A code is not a valid packed code of cls
+    """
+    codes = np.asarray(codes, dtype=np.uint64)
+    _check_codes(cls, codes)
+    table = get_score_table(cls, version)
+    unique, inverse = np.unique(codes, return_inverse=True)
+    env = _env_scores(cls, version, unique)
+    return table.base_scores(codes), table.temporal_scores(codes), env[inverse.reshape(-1)]
@@ -0,0 +1,86 @@
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss, CvssVersion, _VERSIONS, _restore_cvss
+from cvss.codec import score_codes
+
+
+@dataclass
+class CvssCorpus:
+    """
+    Columnar storage of scored vectors of a single CVSS class and version: one packed code and three scores per row.
+    Rows are identified by ids, usually the CVE ids.
+    """
+    cls: type[AbcCvss]
+    version: CvssVersion
+    ids: list[str]
+    codes: np.ndarray
+    base_scores: np.ndarray
+    temporal_scores: np.ndarray
+    env_scores: np.ndarray
+    _rows: dict[str, int] | None = field(init=False, default=None, repr=False)
+
+    @classmethod
+    def from_codes(cls, cvss_cls: type[AbcCvss], version: CvssVersion, ids: list[str], codes: Iterable[int]):
+        codes = np.fromiter(codes, dtype=np.uint64)
+        base, temporal, env = score_codes(cvss_cls, version, codes)
+        return cls(cvss_cls, version, list(ids), codes, base, temporal, env)
+
+    @classmethod
+    def from_objects(cls, ids: list[str], objects: list[AbcCvss]):
+        """
+        Constructor with CVSS objects, they must all have the same class and version.
+        :param ids:
+        :param objects:
+        :return:
+        """
+        kinds = {(type(cvss), cvss.version) for cvss in objects}
+        if len(kinds) != 1:
+            raise ValueError(f'Expected objects of a single class and version, got {len(kinds)}')
+        cvss_cls, version = kinds.pop()
+        return cls.from_codes(cvss_cls, version, ids, (cvss.to_packed() for cvss in objects))
+
+    @classmethod
+    def from_vector_strings(cls, cvss_cls: type[AbcCvss], ids: list[str], values: Iterable[str]):
+        """
+        Constructor with vector strings, each distinct string is parsed once. Every string must give the same version.
+        :param cvss_cls: The CVSS class used to parse the vector strings
+        :param ids:
+        :param values:
+        :return:
+        """
+        parsed: dict[str, tuple[CvssVersion, int]] = {}
+        codes = []
+        for value in values:
+            if value not in parsed:
+                cvss = cvss_cls.from_vector_string(value)
+                parsed[value] = (cvss.version, cvss.to_packed())
+            codes.append(parsed[value][1])
+        versions = {version for version, _ in parsed.values()}
+        if len(versions) != 1:
+            raise ValueError(f'Expected vector strings of a single version, got {len(versions)}')
+        return cls.from_codes(cvss_cls, versions.pop(), ids, codes)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def row_of(self, cvss_id: str) -> int | None:
+        if self._rows is None:
+            self._rows = {cvss_id: row for row, cvss_id in enumerate(self.ids)}
+        return self._rows.get(cvss_id)
+
+    def get(self, row: int) -> AbcCvss:
+        return _restore_cvss(self.cls, _VERSIONS.index(self.version), int(self.codes[row]))
+
+    def rescore(self, rows: np.ndarray) -> None:
+        """
+        Compute again the scores of rows after their codes changed.
+        :param rows:
+        :return: None
+        """
+        base, temporal, env = score_codes(self.cls, self.version, self.codes[rows])
+        self.base_scores[rows] = base
+        self.temporal_scores[rows] = temporal
+        self.env_scores[rows] = env
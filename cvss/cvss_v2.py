@@ -1,9 +1,10 @@
 from dataclasses import dataclass, field
-from typing import Any, Callable
-import numpy as np
+from typing import Any, Callable, ClassVar, Iterable
 import re
 
 from abs.abc_cvss import AbcCvss, AbcVector, CvssVersion
+from abs.exceptions import InvalidVectorStringError
+from cvss.projection import Projection, get_projection
 
 cvss_v2_regex_pattern = re.compile(r"^AV:[N,AL]/AC:[MLH]/Au:[MSN]/C:[NPC]/I:[NPC]/A:[NPC](/E:(POC|ND|[UFH]))?(/RL:(OF|TF|ND|[UW]))?(/RC:(UC|UR|ND|C))?$")
 # CVSS_V2_METRIC_REGEX_PATTERN = re.compile(r'(?<=:)[A-Za-z]+')
@@ -97,6 +98,17 @@ class ReportConfidence(AbcVector):
 
 @dataclass
 class CvssV2(AbcCvss):
+    VECTOR_KEYS: ClassVar[dict[str, str]] = {
+        'access_vector': 'AV', 'access_complexity': 'AC', 'authentication': 'Au', 'confidentiality_impact': 'C',
+        'integrity_impact': 'I', 'availability_impact': 'A', 'exploitability': 'E', 'remediation_level': 'RL',
+        'report_confidence': 'RC'}
+    TEMPORAL_FIELDS: ClassVar[tuple[str, ...]] = ('exploitability', 'remediation_level', 'report_confidence')
+    PRIMITIVE_KEYS: ClassVar[dict[str, str]] = {
+        'access_vector': 'accessVector', 'access_complexity': 'accessComplexity', 'authentication': 'authentication',
+        'confidentiality_impact': 'confidentialityImpact', 'integrity_impact': 'integrityImpact',
+        'availability_impact': 'availabilityImpact', 'exploitability': 'exploitability',
+        'remediation_level': 'remediationLevel', 'report_confidence': 'reportConfidence'}
+
     access_vector: AccessVector
     access_complexity: AccessComplexity
     authentication: Authentication
@@ -108,9 +120,14 @@ class CvssV2(AbcCvss):
     report_confidence: ReportConfidence = field(default=ReportConfidence.NOT_DEFINED)
 
     @classmethod
-    def from_vector_string(cls, value: str):
-        if cvss_v2_regex_pattern.match(value) is None:
-            raise Exception  # TODO create exception
+    def check_vector_string(cls, vector_string: str) -> None:
+        if cvss_v2_regex_pattern.match(vector_string) is None:
+            raise InvalidVectorStringError(f'Invalid CVSS v2 vector string {vector_string!r}')
+
+    @classmethod
+    def from_vector_string(cls, value: str | bytes | bytearray | memoryview):
+        value = cls.as_vector_str(value)
+        cls.check_vector_string(value)
         metrics = cls.parse_vector_string(value)
         av = AccessVector.from_char(metrics.get('AV'))
         ac = AccessComplexity.from_char(metrics.get('AC'))
@@ -159,9 +176,20 @@ class CvssV2(AbcCvss):
         base_score = self._compute_base_score()
         self.set_base_score(base_score)
         self.set_base_severity(base_score)
+        self.set_temporal_score(self._compute_temporal_score())
         self._vector_string = self._compute_vector_string()
 
-    def to_primitive_dict(self) -> dict[str | Any, str | Any]:
+    def to_primitive_dict(self, fields: Iterable[str] | Projection | None = None) -> dict[str | Any, str | Any]:
+        """
+        :param fields: Only compute these fields, a list of keys or a Projection of this class. All fields by default.
+        :return: dict
+        """
+        if fields is not None:
+            if not isinstance(fields, Projection):
+                fields = get_projection(type(self), tuple(fields))
+            elif fields.cls is not type(self):
+                raise ValueError(f'Projection of {fields.cls.__name__} used on a {type(self).__name__}')
+            return fields.to_dict(self)
         return {
             'vectorString': self.get_vector_string(),
             'accessVector': self.access_vector.to_str(),
@@ -174,7 +202,8 @@ class CvssV2(AbcCvss):
             'remediationLevel': self.remediation_level.to_str(),
             'reportConfidence': self.report_confidence.to_str(),
             'baseScore': self.get_base_score(),
-            'baseSeverity': self.get_base_severity()
+            'baseSeverity': self.get_base_severity(),
+            'temporalScore': self.get_temporal_score()
         }
 
     def _compute_vector_string(self) -> str:
@@ -217,10 +246,10 @@ class CvssV2(AbcCvss):
             return 1.176
 
     def _compute_temporal_score(self) -> float:
-        return np.round(self.get_base_score() *
-                        self.exploitability.to_float() *
-                        self.remediation_level.to_float() *
-                        self.report_confidence.to_float())
+        return self.round_to_one_decimal(self.get_base_score() *
+                                         self.exploitability.to_float() *
+                                         self.remediation_level.to_float() *
+                                         self.report_confidence.to_float())
 
     def _compute_env_score(self) -> float:
         return 666
@@ -1,7 +1,8 @@
 from abc import abstractmethod
-from typing import Self
+from typing import ClassVar, Iterable, Self
 
 from abs.abc_cvss import AbcCvss, AbcVector, CvssVersion
+from cvss.projection import Projection, get_projection
 
 from dataclasses import dataclass, field
 import numpy as np
@@ -90,7 +91,7 @@ class ModifiedPrivilegesRequired(AbcVector):
         return super().to_str(value)
 
     def to_float(self, scope: Scope) -> float:
-        if self.value == PrivilegesRequired.NONE or scope == Scope.UNCHANGED:
+        if self is ModifiedPrivilegesRequired.NONE or scope == Scope.UNCHANGED:
             return self.value[2]
         return self.value[3]
 
@@ -233,6 +234,27 @@ class AvailabilityRequirement(AbcVector):
 
 @dataclass
 class CvssV3(AbcCvss):
+    VECTOR_KEYS: ClassVar[dict[str, str]] = {
+        'attack_vector': 'AV', 'attack_complexity': 'AC', 'privileges_required': 'PR', 'user_interaction': 'UI',
+        'scope': 'S', 'confidentiality_impact': 'C', 'integrity_impact': 'I', 'availability_impact': 'A',
+        'exploit_code_maturity': 'E', 'remediation_level': 'RL', 'report_confidence': 'RC',
+        'mod_attack_vector': 'MAV', 'mod_attack_complexity': 'MAC', 'mod_privileges_required': 'MPR',
+        'mod_user_interaction': 'MUI', 'mod_scope': 'MS', 'mod_confidentiality_impact': 'MC',
+        'mod_integrity_impact': 'MI', 'mod_availability_impact': 'MA', 'confidentiality_requirement': 'CR',
+        'integrity_requirement': 'IR', 'availability_requirement': 'AR'}
+    TEMPORAL_FIELDS: ClassVar[tuple[str, ...]] = ('exploit_code_maturity', 'remediation_level', 'report_confidence')
+    PRIMITIVE_KEYS: ClassVar[dict[str, str]] = {
+        'attack_vector': 'attackVector', 'attack_complexity': 'attackComplexity',
+        'privileges_required': 'privilegesRequired', 'user_interaction': 'userInteraction', 'scope': 'scope',
+        'confidentiality_impact': 'confidentialityImpact', 'integrity_impact': 'integrityImpact',
+        'availability_impact': 'availabilityImpact', 'exploit_code_maturity': 'exploitCodeMaturity',
+        'remediation_level': 'remediationLevel', 'report_confidence': 'reportConfidence',
+        'mod_attack_vector': 'modifiedAttackVector', 'mod_attack_complexity': 'modifiedAttackComplexity',
+        'mod_privileges_required': 'modifiedPrivilegesRequired', 'mod_user_interaction': 'modifiedUserInteraction',
+        'mod_scope': 'modifiedScope', 'mod_confidentiality_impact': 'modifiedConfidentialityImpact',
+        'mod_integrity_impact': 'modifiedIntegrityImpact', 'mod_availability_impact': 'modifiedAvailabilityImpact',
+        'confidentiality_requirement': 'confidentialityRequirement', 'integrity_requirement': 'integrityRequirement',
+        'availability_requirement': 'availabilityRequirement'}
 
     attack_vector: AttackVector
     attack_complexity: AttackComplexity
@@ -258,7 +280,7 @@ class CvssV3(AbcCvss):
     availability_requirement: AvailabilityRequirement = field(default=AvailabilityRequirement.NOT_DEFINED)
 
     @classmethod
-    def from_vector_string(cls, value: str):
+    def from_vector_string(cls, value: str | bytes | bytearray | memoryview):
         # if cvss_v3_regex_pattern.match(value) is None:
         #     raise Exception  # TODO create exception
         metrics = cls.parse_vector_string(value)
@@ -363,6 +385,7 @@ class CvssV3(AbcCvss):
         base_score = self._compute_base_score()
         self.set_base_score(base_score)
         self.set_base_severity(base_score)
+        self.set_temporal_score(self._compute_temporal_score())
 
         env_score = self._compute_env_score()
         self.set_env_score(env_score)
@@ -389,7 +412,17 @@ class CvssV3(AbcCvss):
         self.availability_requirement = value
         self.set_env_score(self._compute_env_score())
 
-    def to_primitive_dict(self) -> dict:
+    def to_primitive_dict(self, fields: Iterable[str] | Projection | None = None) -> dict:
+        """
+        :param fields: Only compute these fields, a list of keys or a Projection of this class. All fields by default.
+        :return: dict
+        """
+        if fields is not None:
+            if not isinstance(fields, Projection):
+                fields = get_projection(type(self), tuple(fields))
+            elif fields.cls is not type(self):
+                raise ValueError(f'Projection of {fields.cls.__name__} used on a {type(self).__name__}')
+            return fields.to_dict(self)
         return {
             'vectorString': self.get_vector_string(),
             'attackVector': self.attack_vector.to_str(),
@@ -415,7 +448,8 @@ class CvssV3(AbcCvss):
             'integrityRequirement': self.integrity_requirement.to_str(),
             'availabilityRequirement': self.availability_requirement.to_str(),
             'baseScore': self.get_base_score(),
-            'baseSeverity': self.get_base_severity()
+            'baseSeverity': self.get_base_severity(),
+            'temporalScore': self.get_temporal_score()
         }
 
     def _compute_vector_string(self) -> str:
@@ -488,3 +522,11 @@ class CvssV3(AbcCvss):
             return int_value / 100000.0
         else:
             return (np.floor(int_value / 10000) + 1) / 10.0
+
+    @staticmethod
+    def roundup_array(values: np.ndarray) -> np.ndarray:
+        """
+        Same as roundup, element-wise on an array.
+        """
+        int_values = np.rint(values * 100000)
+        return np.where(int_values % 10000 == 0, int_values / 100000.0, (np.floor(int_values / 10000) + 1) / 10.0)
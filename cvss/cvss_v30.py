@@ -1,5 +1,16 @@
-from cvss_v3 import CvssV3
+from cvss.cvss_v3 import ModifiedScope, Scope
+from cvss.cvss_v31 import CvssV31
 
 
-class CvssV30(CvssV3):
-    pass
+class CvssV30(CvssV31):
+    """
+    CVSS v3.0, which only differs from v3.1 by the modified impact of a changed scope.
+    """
+
+    def _compute_mod_impact_score(self) -> float:
+        isc: float = self._compute_mod_isc()
+        scope = self.mod_scope if self.mod_scope else self.scope
+        if scope is ModifiedScope.UNCHANGED or scope is Scope.UNCHANGED:
+            return 6.42 * isc
+        else:
+            return 7.52 * (isc - 0.029) - 3.25 * pow((isc - 0.02), 15)
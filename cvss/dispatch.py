@@ -0,0 +1,155 @@
+from typing import Iterable
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss
+from abs.exceptions import InvalidRecordError, InvalidVersionError
+from cvss.corpus import CvssCorpus
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v30 import CvssV30
+from cvss.cvss_v31 import CvssV31
+
+# NVD metric keys, the most recent version first.
+METRIC_CLASSES: dict[str, type[AbcCvss]] = {'cvssMetricV31': CvssV31, 'cvssMetricV30': CvssV30,
+                                            'cvssMetricV2': CvssV2}
+VERSION_CLASSES: dict[str, type[AbcCvss]] = {'3.1': CvssV31, '3.0': CvssV30, '2.0': CvssV2}
+
+
+def primary_entry(entries: list[dict]) -> dict:
+    """
+    The entry of type Primary of an NVD metric list, the first entry if there is none.
+    :param entries:
+    :return: dict
+    """
+    for entry in entries:
+        if entry.get('type') == 'Primary':
+            return entry
+    return entries[0]
+
+
+def _metric_list(value: list) -> list[dict]:
+    """
+    Check that value is a non empty NVD metric list, each entry with a cvssData object.
+    """
+    if not isinstance(value, list) or not value or \
+            not all(isinstance(entry, dict) and isinstance(entry.get('cvssData'), dict) for entry in value):
+        raise InvalidRecordError('Expected a non empty list of NVD metrics with cvssData')
+    return value
+
+
+def _metric_entries(value: dict | list) -> tuple[type[AbcCvss], list[dict]]:
+    """
+    Class and NVD metric list of an NVD record: a CVE item, its metrics object or a metric list.
+    """
+    if isinstance(value, list):
+        entries = _metric_list(value)
+        version = entries[0]['cvssData'].get('version')
+        if version not in VERSION_CLASSES:
+            raise InvalidVersionError(f'Unknown CVSS version {version!r}')
+        return VERSION_CLASSES[version], entries
+    for key in ('cve', 'metrics'):
+        if not isinstance(value, dict):
+            break
+        value = value.get(key, value)
+    if not isinstance(value, dict):
+        raise InvalidRecordError(f'Expected an NVD record, got {type(value).__name__}')
+    for key, cls in METRIC_CLASSES.items():
+        if value.get(key):
+            return cls, _metric_list(value[key])
+    raise InvalidRecordError('No CVSS metric found in the NVD record')
+
+
+def detect_class(value: str | bytes | bytearray | memoryview | dict | list) -> type[AbcCvss]:
+    """
+    CVSS class of a vector string, from its "CVSS:3.x/" prefix or its v2 shape, or of an NVD record, from its
+    metric key.
+    :param value:
+    :return: CvssV2, CvssV30 or CvssV31
+    """
+    if isinstance(value, (dict, list)):
+        return _metric_entries(value)[0]
+    value = AbcCvss.as_vector_str(value)
+    if value.startswith('CVSS:'):
+        cls = VERSION_CLASSES.get(value[5:8])
+        if cls is not None and cls is not CvssV2:
+            return cls
+    elif value.startswith('AV:'):
+        return CvssV2
+    raise InvalidVersionError(f'Unknown CVSS version for {value!r}')
+
+
+def parse_any(value: str | bytes | bytearray | memoryview | dict | list) -> AbcCvss:
+    """
+    Parse a vector string or an NVD record of any CVSS version. For an NVD record, the most recent version is
+    used and, in its metric list, the Primary entry.
+    :param value:
+    :return: AbcCvss
+    """
+    if isinstance(value, (dict, list)):
+        cls, entries = _metric_entries(value)
+        try:
+            return cls.from_primitive_dict([primary_entry(entries)])
+        except KeyError as e:
+            raise InvalidRecordError(f'Missing {e} in the NVD record') from None
+    return detect_class(value).from_vector_string(value)
+
+
+def score_any(value: str | bytes | bytearray | memoryview | dict | list) -> tuple[float, float, float | None]:
+    """
+    :return: The base, temporal and environmental scores of value, see parse_any
+    """
+    cvss = parse_any(value)
+    return cvss.get_base_score(), cvss.get_temporal_score(), cvss.get_env_score()
+
+
+def _group_rows(values: list) -> dict[type[AbcCvss], list[int]]:
+    groups: dict[type[AbcCvss], list[int]] = {}
+    for row, value in enumerate(values):
+        groups.setdefault(detect_class(value), []).append(row)
+    return groups
+
+
+def parse_many(values: Iterable) -> list[AbcCvss]:
+    """
+    Same as parse_any for a batch of mixed versions. Rows are grouped by class, each distinct vector string is
+    parsed once, and the objects are returned in the input order. Objects of the same vector are shared.
+    :param values:
+    :return: list
+    """
+    values = list(values)
+    result: list[AbcCvss | None] = [None] * len(values)
+    for cls, rows in _group_rows(values).items():
+        parsed: dict[str, AbcCvss] = {}
+        for row in rows:
+            value = values[row]
+            if isinstance(value, (dict, list)):
+                result[row] = parse_any(value)
+                continue
+            value = AbcCvss.as_vector_str(value)
+            cvss = parsed.get(value)
+            if cvss is None:
+                cvss = parsed[value] = cls.from_vector_string(value)
+            result[row] = cvss
+    return result
+
+
+def score_many(values: Iterable) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Same as score_any for a batch of mixed versions. The vector strings of each version are scored together from
+    their packed codes, see CvssCorpus. A missing environmental score is nan.
+    :param values:
+    :return: The base, temporal and environmental scores, in the input order
+    """
+    values = list(values)
+    scores = np.full((3, len(values)), np.nan)
+    for cls, rows in _group_rows(values).items():
+        vector_rows = [row for row in rows if not isinstance(values[row], (dict, list))]
+        for row in rows:
+            if isinstance(values[row], (dict, list)):
+                scores[:, row] = [np.nan if score is None else score for score in score_any(values[row])]
+        if vector_rows:
+            corpus = CvssCorpus.from_vector_strings(cls, [str(row) for row in vector_rows],
+                                                    (AbcCvss.as_vector_str(values[row]) for row in vector_rows))
+            scores[:, vector_rows] = (corpus.base_scores, corpus.temporal_scores, corpus.env_scores)
+    return scores[0], scores[1], scores[2]
+
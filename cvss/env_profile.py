@@ -0,0 +1,143 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from itertools import product
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss, CvssVersion, MetricField
+from cvss.cvss_v3 import CvssV3, ModifiedAttackVector, ModifiedAttackComplexity, ModifiedPrivilegesRequired, \
+    ModifiedUserInteraction, ModifiedScope, ModifiedConfidentialityImpact, ModifiedIntegrityImpact, \
+    ModifiedAvailabilityImpact, ConfidentialityRequirement, IntegrityRequirement, AvailabilityRequirement
+
+
+@dataclass(frozen=True)
+class EnvironmentalProfile:
+    """
+    Environmental metrics of an asset: security requirements and modified base metrics.
+    """
+    mod_attack_vector: ModifiedAttackVector = field(default=ModifiedAttackVector.NOT_DEFINED)
+    mod_attack_complexity: ModifiedAttackComplexity = field(default=ModifiedAttackComplexity.NOT_DEFINED)
+    mod_privileges_required: ModifiedPrivilegesRequired = field(default=ModifiedPrivilegesRequired.NOT_DEFINED)
+    mod_user_interaction: ModifiedUserInteraction = field(default=ModifiedUserInteraction.NOT_DEFINED)
+    mod_scope: ModifiedScope = field(default=ModifiedScope.NOT_DEFINED)
+    mod_confidentiality_impact: ModifiedConfidentialityImpact = field(default=ModifiedConfidentialityImpact.NOT_DEFINED)
+    mod_integrity_impact: ModifiedIntegrityImpact = field(default=ModifiedIntegrityImpact.NOT_DEFINED)
+    mod_availability_impact: ModifiedAvailabilityImpact = field(default=ModifiedAvailabilityImpact.NOT_DEFINED)
+    confidentiality_requirement: ConfidentialityRequirement = field(default=ConfidentialityRequirement.NOT_DEFINED)
+    integrity_requirement: IntegrityRequirement = field(default=IntegrityRequirement.NOT_DEFINED)
+    availability_requirement: AvailabilityRequirement = field(default=AvailabilityRequirement.NOT_DEFINED)
+
+    @classmethod
+    def from_vector_string(cls, value: str):
+        """
+        Constructor with the environmental part of a vector string. Example: "CR:H/IR:L/MAV:N"
+        :param value:
+        :return:
+        """
+        metrics = AbcCvss.parse_vector_string(value)
+        names = {key: name for name, key in CvssV3.VECTOR_KEYS.items()}
+        types = {f.name: f.type for f in fields(cls)}
+        return cls(**{names[key]: types[names[key]].from_char(char) for key, char in metrics.items()})
+
+    @classmethod
+    def from_cvss(cls, cvss: CvssV3):
+        return cls(**{f.name: getattr(cvss, f.name) for f in fields(cls)})
+
+
+def _dense_index(metrics: list[MetricField], codes: np.ndarray) -> np.ndarray:
+    index = np.zeros(len(codes), dtype=np.int64)
+    for metric in metrics:
+        index = index * len(metric.members) + ((codes >> np.uint64(metric.shift)) & np.uint64(metric.mask)).astype(
+            np.int64)
+    return index
+
+
+class CompiledProfile:
+    """
+    Environmental scores of every base and temporal vector under one EnvironmentalProfile, in a single table.
+    Scoring a vector is then one lookup: its environmental metrics are replaced by the ones of the profile.
+    """
+
+    def __init__(self, cls: type[CvssV3], version: CvssVersion, profile: EnvironmentalProfile):
+        self.cls = cls
+        self.version = version
+        self.profile = profile
+        layout = cls.metric_layout()
+        self._base = [metric for metric in layout if metric.group == 'base']
+        self._temporal = [metric for metric in layout if metric.group == 'temporal']
+
+        # Environmental score of every base vector with no temporal metric, computed by the class itself.
+        template = cls.from_packed(sum(metric.code_of(metric.default) << metric.shift
+                                       for metric in layout if not metric.is_base), version)
+        for f in fields(profile):
+            setattr(template, f.name, getattr(profile, f.name))
+        env = []
+        for members in product(*(metric.members for metric in self._base)):
+            for metric, member in zip(self._base, members):
+                setattr(template, metric.name, member)
+            env.append(template._compute_env_score())
+        env = np.array(env, dtype=float)
+
+        # The temporal metrics multiply the rounded score before the last roundup, as in _compute_env_score.
+        table = env.reshape((-1,) + (1,) * len(self._temporal))
+        for position, metric in enumerate(self._temporal):
+            shape = [1] * (len(self._temporal) + 1)
+            shape[position + 1] = len(metric.members)
+            table = table * np.array([member.to_float() for member in metric.members]).reshape(shape)
+        self.table = cls.roundup_array(table).reshape(-1)
+
+    def score(self, cvss: CvssV3) -> float:
+        return float(self.score_codes(np.array([cvss.to_packed()], dtype=np.uint64))[0])
+
+    def score_codes(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Environmental scores of packed codes, see AbcCvss.to_packed.
+        :param codes:
+        :return: np.ndarray
+        """
+        codes = np.asarray(codes, dtype=np.uint64)
+        return self.table[_dense_index(self._base + self._temporal, codes)]
+
+
+class ProfileCache:
+    """
+    Least recently used cache of compiled profiles, with explicit eviction.
+    """
+
+    def __init__(self, max_size: int = 64):
+        self.max_size = max_size
+        self._profiles: OrderedDict[tuple, CompiledProfile] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def get(self, cls: type[CvssV3], version: CvssVersion, profile: EnvironmentalProfile) -> CompiledProfile:
+        key = (cls, version, profile)
+        compiled = self._profiles.get(key)
+        if compiled is None:
+            compiled = CompiledProfile(cls, version, profile)
+            self._profiles[key] = compiled
+            if len(self._profiles) > self.max_size:
+                self._profiles.popitem(last=False)
+        else:
+            self._profiles.move_to_end(key)
+        return compiled
+
+    def evict(self, profile: EnvironmentalProfile) -> None:
+        """
+        Remove every compiled version of profile.
+        :param profile:
+        :return: None
+        """
+        for key in [key for key in self._profiles if key[2] == profile]:
+            del self._profiles[key]
+
+    def clear(self) -> None:
+        self._profiles.clear()
+
+
+PROFILE_CACHE = ProfileCache()
+
+
+def compile_profile(cls: type[CvssV3], version: CvssVersion, profile: EnvironmentalProfile) -> CompiledProfile:
+    return PROFILE_CACHE.get(cls, version, profile)
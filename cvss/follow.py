@@ -0,0 +1,188 @@
+import json
+import os
+import pickle
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import BinaryIO, Callable, Iterable
+
+from abs.abc_cvss import AbcCvss
+from abs.exceptions import CvssError
+from cvss.dispatch import parse_any
+from cvss.intern_table import VectorInternTable
+from cvss.sharding import PartialResult
+
+CHECKPOINT_FORMAT_VERSION = 1
+
+
+@dataclass
+class FileCursor:
+    """
+    Position in a followed file: the offset after its last complete line, and the inode of the file it belongs to.
+    """
+    path: str
+    inode: int | None = None
+    offset: int = 0
+    handle: BinaryIO | None = None
+
+    def close(self) -> None:
+        if self.handle is not None:
+            self.handle.close()
+            self.handle = None
+
+
+class LogFollower:
+    """
+    Follow growing JSONL files, like "tail -F", and aggregate the records appended since the last poll.
+    Each line is a finding like {"id": "CVE-...", "vectorString": "CVSS:3.1/..."}.
+    A rotated file (new inode) is read to its end then the new file is read from its start, a truncated file is
+    read again from its start. Offsets and aggregates can be checkpointed, a follower started with the same
+    checkpoint resumes after the last line it aggregated.
+    """
+
+    def __init__(self, paths: Iterable[str], cls: type[AbcCvss] | None = None, checkpoint_path: str | None = None,
+                 k: int = 10, score: str = 'base', vector_key: str = 'vectorString', id_key: str = 'id',
+                 cache_size: int = 65536, read_size: int = 1 << 20):
+        """
+        :param paths:
+        :param cls: The CVSS class used to parse the vector strings, by default it is detected for each line
+        :param checkpoint_path: File written by checkpoint and read at start, if it exists
+        :param k: Size of the top k, see PartialResult
+        :param score: 'base', 'temporal' or 'env'
+        :param vector_key:
+        :param id_key:
+        :param cache_size: Number of distinct vector strings kept parsed
+        :param read_size: Number of bytes read at once, a poll reads the new lines by blocks of read_size
+        """
+        self.cursors = {path: FileCursor(path) for path in paths}
+        self.checkpoint_path = checkpoint_path
+        self.vector_key = vector_key
+        self.id_key = id_key
+        self.read_size = read_size
+        self.aggregates = PartialResult(k, score)
+        self._parse = parse_any if cls is None else cls.from_vector_string
+        self._prepare = lru_cache(maxsize=cache_size)(self._prepare_vector)
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            self._restore()
+
+    def _restore(self) -> None:
+        with open(self.checkpoint_path, 'rb') as f:
+            format_version, files, aggregates = pickle.load(f)
+        if format_version != CHECKPOINT_FORMAT_VERSION:
+            raise ValueError(f'Unsupported checkpoint format {format_version}')
+        self.aggregates = aggregates
+        for path, (inode, offset) in files.items():
+            if path in self.cursors:
+                self.cursors[path].inode = inode
+                self.cursors[path].offset = offset
+
+    def checkpoint(self) -> None:
+        """
+        Write the offsets and the aggregates, atomically.
+        :return: None
+        :raise ValueError: The follower has no checkpoint_path
+        """
+        if self.checkpoint_path is None:
+            raise ValueError('LogFollower has no checkpoint_path to write the checkpoint to')
+        files = {path: (cursor.inode, cursor.offset) for path, cursor in self.cursors.items()}
+        temporary = f'{self.checkpoint_path}.tmp'
+        with open(temporary, 'wb') as f:
+            pickle.dump((CHECKPOINT_FORMAT_VERSION, files, self.aggregates), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, self.checkpoint_path)
+
+    def close(self) -> None:
+        for cursor in self.cursors.values():
+            cursor.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _prepare_vector(self, vector_string: str) -> tuple[tuple[type, int, int], float | None]:
+        """
+        Key and score of a vector string, computed once per distinct vector string.
+        """
+        cvss = self._parse(vector_string)
+        return VectorInternTable.key_of(cvss), self.aggregates.score_of(cvss)
+
+    def _add_line(self, line: bytes) -> None:
+        try:
+            record = json.loads(line)
+            key, score = self._prepare(record[self.vector_key])
+        except (ValueError, KeyError, TypeError, CvssError):
+            self.aggregates.invalid += 1
+            return
+        # Ids are compared when scores tie in the top k, a numeric id is kept as a string like the others.
+        self.aggregates.add_key(str(record.get(self.id_key, '')), key, score)
+
+    def _read(self, cursor: FileCursor) -> int:
+        """
+        Aggregate the complete lines after the cursor, read_size bytes at a time, a partial last line is left for
+        the next poll.
+        """
+        cursor.handle.seek(cursor.offset)
+        count = 0
+        pending = b''
+        while data := cursor.handle.read(self.read_size):
+            data = pending + data
+            end = data.rfind(b'\n') + 1
+            lines = data[:end].splitlines()
+            for line in lines:
+                if line.strip():
+                    self._add_line(line)
+            count += len(lines)
+            cursor.offset += end
+            pending = data[end:]
+        return count
+
+    def _poll_file(self, cursor: FileCursor) -> int:
+        try:
+            stat = os.stat(cursor.path)
+        except FileNotFoundError:
+            # Rotated and not created again yet: finish the old file if it is still open.
+            return self._read(cursor) if cursor.handle is not None else 0
+        lines = 0
+        if cursor.inode != stat.st_ino:
+            if cursor.handle is not None:
+                lines += self._read(cursor)
+                cursor.close()
+                cursor.offset = 0
+            elif cursor.inode is not None:
+                # Rotated while no follower was running, the end of the old file is lost.
+                cursor.offset = 0
+            cursor.inode = stat.st_ino
+        elif stat.st_size < cursor.offset:
+            cursor.offset = 0
+        if cursor.handle is None:
+            cursor.handle = open(cursor.path, 'rb')
+        return lines + self._read(cursor)
+
+    def poll(self) -> int:
+        """
+        Aggregate the lines appended to every file since the last poll.
+        :return: The number of new lines
+        """
+        return sum(self._poll_file(cursor) for cursor in self.cursors.values())
+
+    def follow(self, interval: float = 0.2, on_update: Callable[['LogFollower'], None] | None = None,
+               checkpoint_interval: float = 5.0, stop: Callable[[], bool] | None = None) -> None:
+        """
+        Poll every interval seconds until stop returns True, calling on_update after each poll with new lines.
+        :param interval:
+        :param on_update:
+        :param checkpoint_interval: Minimum number of seconds between two checkpoints, when checkpoint_path is set
+        :param stop:
+        :return: None
+        """
+        last_checkpoint = time.monotonic()
+        while stop is None or not stop():
+            if self.poll() and on_update is not None:
+                on_update(self)
+            if self.checkpoint_path is not None and time.monotonic() - last_checkpoint >= checkpoint_interval:
+                self.checkpoint()
+                last_checkpoint = time.monotonic()
+            time.sleep(interval)
+        if self.checkpoint_path is not None:
+            self.checkpoint()
@@ -0,0 +1,90 @@
+from typing import Iterable
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss, _VERSIONS, _restore_cvss
+
+
+class VectorInternTable:
+    """
+    Dictionary encoding of CVSS objects: every distinct vector gets a small integer id and one shared scored instance.
+    A corpus can then store only the ids, so memory and scoring cost follow the number of distinct vectors.
+    The shared instances must be treated as read-only, a setter call on one of them changes every row using its id.
+    """
+
+    def __init__(self):
+        self._ids: dict[tuple[type, int, int], int] = {}
+        self._ids_by_string: dict[tuple[type, str], int] = {}
+        self._keys: list[tuple[type, int, int]] = []
+        self._objects: list[AbcCvss] = []
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    @staticmethod
+    def key_of(cvss: AbcCvss) -> tuple[type, int, int]:
+        """
+        Identity of a vector for the deduplication: its class, its version and its packed metrics.
+        :param cvss:
+        :return: tuple
+        """
+        return type(cvss), _VERSIONS.index(cvss.version), cvss.to_packed()
+
+    def keys(self) -> list[tuple[type, int, int]]:
+        return list(self._keys)
+
+    def _intern_key(self, key: tuple[type, int, int]) -> int:
+        vector_id = self._ids.get(key)
+        if vector_id is None:
+            vector_id = len(self._keys)
+            self._ids[key] = vector_id
+            self._keys.append(key)
+            self._objects.append(_restore_cvss(*key))
+        return vector_id
+
+    def intern(self, cvss: AbcCvss) -> int:
+        """
+        Return the id of the vector of cvss, adding it to the table if needed.
+        :param cvss:
+        :return: int
+        """
+        return self._intern_key(self.key_of(cvss))
+
+    def intern_vector_string(self, cls: type[AbcCvss], value: str) -> int:
+        """
+        Same as intern but from a vector string, which is parsed only the first time it is seen.
+        :param cls: The CVSS class used to parse the vector string, CvssV2 or CvssV31 for example
+        :param value:
+        :return: int
+        """
+        vector_id = self._ids_by_string.get((cls, value))
+        if vector_id is None:
+            vector_id = self.intern(cls.from_vector_string(value))
+            self._ids_by_string[(cls, value)] = vector_id
+        return vector_id
+
+    def encode(self, objects: Iterable[AbcCvss]) -> np.ndarray:
+        return np.fromiter((self.intern(cvss) for cvss in objects), dtype=np.int32)
+
+    def encode_vector_strings(self, cls: type[AbcCvss], values: Iterable[str]) -> np.ndarray:
+        return np.fromiter((self.intern_vector_string(cls, value) for value in values), dtype=np.int32)
+
+    def get(self, vector_id: int) -> AbcCvss:
+        return self._objects[vector_id]
+
+    def decode(self, ids: Iterable[int]) -> list[AbcCvss]:
+        """
+        Return the shared instance of every id.
+        :param ids:
+        :return: list
+        """
+        objects = self._objects
+        return [objects[vector_id] for vector_id in np.asarray(ids).tolist()]
+
+    def merge(self, other: 'VectorInternTable') -> np.ndarray:
+        """
+        Add every vector of other to this table.
+        :param other:
+        :return: An array mapping each id of other to its id in this table, apply it to rows encoded with other.
+        """
+        return np.fromiter((self._intern_key(key) for key in other._keys), dtype=np.int32, count=len(other))
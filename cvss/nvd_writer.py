@@ -0,0 +1,153 @@
+import gzip
+import json
+from typing import Iterable, TextIO
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss, CvssSeverity, CvssVersion, _VERSIONS, _restore_cvss
+from cvss.corpus import CvssCorpus
+
+METRIC_KEYS = {
+    CvssVersion.CVSS_V2: 'cvssMetricV2',
+    CvssVersion.CVSS_V30: 'cvssMetricV30',
+    CvssVersion.CVSS_V31: 'cvssMetricV31',
+}
+
+
+def nvd_vector_string(cvss: AbcCvss) -> str:
+    """
+    Vector string as published by the NVD: the "CVSS:3.x/" prefix for v3, then the base metrics and the other
+    metrics that are defined.
+    Example: CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H/E:P
+    :param cvss:
+    :return: str
+    """
+    parts = [] if cvss.version == CvssVersion.CVSS_V2 else [f'CVSS:{cvss.version}']
+    for metric in cvss.metric_layout():
+        member = getattr(cvss, metric.name)
+        if metric.is_base or member is not metric.default:
+            parts.append(f'{metric.key}:{member.value[1]}')
+    return '/'.join(parts)
+
+
+def nvd_metric(cvss: AbcCvss, source: str = 'cvss-lib', metric_type: str = 'Primary') -> dict:
+    """
+    NVD 2.0 metric entry of cvss, the element of the cvssMetricV2, cvssMetricV30 or cvssMetricV31 lists.
+    It can be read back with from_primitive_dict([entry]).
+    :param cvss:
+    :param source:
+    :param metric_type:
+    :return: dict
+    """
+    cvss_data = {'version': str(cvss.version), 'vectorString': nvd_vector_string(cvss)}
+    for metric in cvss.metric_layout():
+        member = getattr(cvss, metric.name)
+        if metric.is_base or member is not metric.default:
+            cvss_data[cvss.PRIMITIVE_KEYS[metric.name]] = member.value[0]
+    base_severity = str(cvss.get_base_severity())
+    cvss_data['baseScore'] = float(cvss.get_base_score())
+    if cvss.version != CvssVersion.CVSS_V2:
+        cvss_data['baseSeverity'] = base_severity
+    if cvss.get_temporal_score() is not None:
+        cvss_data['temporalScore'] = float(cvss.get_temporal_score())
+    if cvss.get_env_score() is not None:
+        cvss_data['environmentalScore'] = float(cvss.get_env_score())
+        if cvss.version != CvssVersion.CVSS_V2:
+            cvss_data['environmentalSeverity'] = str(CvssSeverity.from_float(cvss.get_env_score()))
+    entry = {'source': source, 'type': metric_type, 'cvssData': cvss_data}
+    if cvss.version == CvssVersion.CVSS_V2:
+        entry['baseSeverity'] = base_severity
+    entry['exploitabilityScore'] = cvss.get_exploitability_score()
+    entry['impactScore'] = cvss.get_impact_score()
+    return entry
+
+
+class NvdJsonWriter:
+    """
+    Stream scored vectors as NVD 2.0 vulnerabilities, one {"cve": {"id": ..., "metrics": {...}}} per row.
+    With fmt='jsonl' every row is a line, with fmt='json' the rows are the "vulnerabilities" list of an NVD response.
+    The metrics fragment of each distinct vector is serialized once, and rows are written by chunks of
+    flush_rows rows. A path ending with .gz, or gzip_output=True, compresses the output.
+    """
+
+    def __init__(self, target: str | TextIO, fmt: str = 'jsonl', gzip_output: bool | None = None,
+                 source: str = 'cvss-lib', metric_type: str = 'Primary', flush_rows: int = 10000):
+        if fmt not in ('json', 'jsonl'):
+            raise ValueError(f'Unknown format {fmt}')
+        self.fmt = fmt
+        self.source = source
+        self.metric_type = metric_type
+        self.flush_rows = flush_rows
+        if isinstance(target, str):
+            if gzip_output is None:
+                gzip_output = target.endswith('.gz')
+            self._fp = gzip.open(target, 'wt', encoding='utf-8') if gzip_output else open(target, 'w', encoding='utf-8')
+            self._owns_fp = True
+        else:
+            self._fp = target
+            self._owns_fp = False
+        self._fragments: dict[tuple[type, int, int], str] = {}
+        self._buffer: list[str] = []
+        self.rows = 0
+        if fmt == 'json':
+            self._fp.write('{"format":"NVD_CVE","version":"2.0","vulnerabilities":[')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _fragment(self, cls: type[AbcCvss], version_tag: int, code: int) -> str:
+        key = (cls, version_tag, code)
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            cvss = _restore_cvss(cls, version_tag, code)
+            entry = nvd_metric(cvss, self.source, self.metric_type)
+            fragment = json.dumps(METRIC_KEYS[cvss.version]) + ':' + json.dumps([entry], separators=(',', ':'))
+            self._fragments[key] = fragment
+        return fragment
+
+    def _write_row(self, cvss_id: str | None, fragment: str) -> None:
+        separator = ',' if self.fmt == 'json' and self.rows else ''
+        end = '\n' if self.fmt == 'jsonl' else ''
+        self._buffer.append(f'{separator}{{"cve":{{"id":{json.dumps(cvss_id)},"metrics":{{{fragment}}}}}}}{end}')
+        self.rows += 1
+        if len(self._buffer) >= self.flush_rows:
+            self.flush()
+
+    def write(self, cvss: AbcCvss, cvss_id: str | None = None) -> None:
+        self._write_row(cvss_id, self._fragment(type(cvss), _VERSIONS.index(cvss.version), cvss.to_packed()))
+
+    def write_many(self, objects: Iterable[AbcCvss], ids: Iterable[str | None]) -> None:
+        for cvss, cvss_id in zip(objects, ids):
+            self.write(cvss, cvss_id)
+
+    def write_codes(self, cls: type[AbcCvss], version: CvssVersion, ids: Iterable[str | None],
+                    codes: np.ndarray) -> None:
+        """
+        Write packed codes, see AbcCvss.to_packed, without building any CVSS object per row.
+        :param cls:
+        :param version:
+        :param ids:
+        :param codes:
+        :return: None
+        """
+        version_tag = _VERSIONS.index(version)
+        for cvss_id, code in zip(ids, np.asarray(codes).tolist()):
+            self._write_row(cvss_id, self._fragment(cls, version_tag, code))
+
+    def write_corpus(self, corpus: CvssCorpus) -> None:
+        self.write_codes(corpus.cls, corpus.version, corpus.ids, corpus.codes)
+
+    def flush(self) -> None:
+        self._fp.write(''.join(self._buffer))
+        self._buffer.clear()
+        self._fp.flush()
+
+    def close(self) -> None:
+        if self.fmt == 'json':
+            self._buffer.append(f'],"totalResults":{self.rows}}}')
+        self.flush()
+        if self._owns_fp:
+            self._fp.close()
@@ -0,0 +1,98 @@
+import csv
+from functools import lru_cache
+from typing import Callable, Iterable, TextIO
+
+from abs.abc_cvss import AbcCvss
+
+# Fields of to_primitive_dict which are not metrics.
+SCORE_FIELDS: dict[str, Callable[[AbcCvss], object]] = {
+    'baseScore': AbcCvss.get_base_score,
+    'baseSeverity': AbcCvss.get_base_severity,
+    'temporalScore': AbcCvss.get_temporal_score,
+}
+
+
+def _metric_getter(name: str, strings: dict) -> Callable[[AbcCvss], str]:
+    def getter(cvss: AbcCvss) -> str:
+        return strings[getattr(cvss, name)]
+    return getter
+
+
+@lru_cache(maxsize=None)
+def field_getters(cls: type[AbcCvss]) -> dict[str, Callable[[AbcCvss], object]]:
+    """
+    Getter of every field of cls.to_primitive_dict, in the same order. The string of every metric member is
+    computed once.
+    :param cls:
+    :return: dict
+    """
+    getters: dict[str, Callable[[AbcCvss], object]] = {'vectorString': AbcCvss.get_vector_string}
+    for metric in cls.metric_layout():
+        strings = {member: member.to_str() for member in metric.members}
+        getters[cls.PRIMITIVE_KEYS[metric.name]] = _metric_getter(metric.name, strings)
+    getters.update(SCORE_FIELDS)
+    return getters
+
+
+class Projection:
+    """
+    A precompiled subset of the fields of to_primitive_dict, for a CVSS class. Only the fields of the projection
+    are computed, as a dict, a tuple or a CSV row.
+    Example: Projection(CvssV31, ['vectorString', 'baseScore']).to_dict(cvss)
+    """
+
+    def __init__(self, cls: type[AbcCvss], fields: Iterable[str]):
+        getters = field_getters(cls)
+        self.cls = cls
+        self.fields = tuple(fields)
+        unknown = [name for name in self.fields if name not in getters]
+        if unknown:
+            raise ValueError(f'Unknown fields {unknown} for {cls.__name__}')
+        self._getters = tuple(getters[name] for name in self.fields)
+
+    def to_tuple(self, cvss: AbcCvss) -> tuple:
+        return tuple(getter(cvss) for getter in self._getters)
+
+    def to_dict(self, cvss: AbcCvss) -> dict:
+        return dict(zip(self.fields, self.to_tuple(cvss)))
+
+    def tuples(self, objects: Iterable[AbcCvss]) -> list[tuple]:
+        """
+        to_tuple of every object, an object shared by several rows (see VectorInternTable) is projected once.
+        :param objects:
+        :return: list
+        """
+        # The objects are kept with their row, so that an id is not reused while the rows are built.
+        rows: dict[int, tuple[AbcCvss, tuple]] = {}
+        result = []
+        for cvss in objects:
+            entry = rows.get(id(cvss))
+            if entry is None:
+                entry = rows[id(cvss)] = (cvss, self.to_tuple(cvss))
+            result.append(entry[1])
+        return result
+
+    def dicts(self, objects: Iterable[AbcCvss]) -> list[dict]:
+        fields = self.fields
+        return [dict(zip(fields, row)) for row in self.tuples(objects)]
+
+    def write_rows(self, objects: Iterable[AbcCvss], fp: TextIO, header: bool = True) -> None:
+        """
+        Write a CSV row per object, with the fields as header.
+        :param objects:
+        :param fp:
+        :param header:
+        :return: None
+        """
+        writer = csv.writer(fp)
+        if header:
+            writer.writerow(self.fields)
+        writer.writerows(self.tuples(objects))
+
+
+@lru_cache(maxsize=1024)
+def get_projection(cls: type[AbcCvss], fields: tuple[str, ...]) -> Projection:
+    """
+    Shared Projection of cls and fields.
+    """
+    return Projection(cls, fields)
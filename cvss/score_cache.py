@@ -0,0 +1,212 @@
+import sqlite3
+import time
+from typing import Iterable, NamedTuple
+
+from abs.abc_cvss import AbcCvss, MetricField
+
+# Version of SCHEMA, an older cache file is emptied and created again.
+SCHEMA_VERSION = 2
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    class TEXT NOT NULL,
+    version TEXT NOT NULL,
+    vector TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    base_score REAL NOT NULL,
+    temporal_score REAL,
+    env_score REAL,
+    severity TEXT NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (class, version, vector, profile)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS scores_last_used ON scores (last_used);
+"""
+# Number of keys of a query of get_many, 4 parameters each, below the oldest SQLite limit of 999 parameters.
+LOOKUP_SIZE = 200
+
+
+class CacheKey(NamedTuple):
+    cls: str
+    version: str
+    vector: str
+    profile: str
+
+
+class CachedScore(NamedTuple):
+    base_score: float
+    temporal_score: float | None
+    env_score: float | None
+    severity: str
+
+
+def _canonical(metrics: Iterable[MetricField], values: dict[str, str]) -> str:
+    return '/'.join(f'{metric.key}:{values[metric.key] if metric.key in values else metric.default.value[1]}'
+                    for metric in metrics)
+
+
+def _key(cls: type[AbcCvss], version: str, values: dict[str, str]) -> CacheKey:
+    # The class is part of the key, CvssV30 and CvssV31 score the same v3.0 vector string differently.
+    layout = cls.metric_layout()
+    return CacheKey(f'{cls.__module__}.{cls.__qualname__}', version,
+                    _canonical((metric for metric in layout if metric.group != 'environmental'), values),
+                    _canonical((metric for metric in layout if metric.group == 'environmental'), values))
+
+
+def cache_key(cls: type[AbcCvss], vector_string: str) -> CacheKey | None:
+    """
+    Key of a vector string: the class, its version, its base and temporal metrics and its environmental metrics,
+    in the order of the class with the default value of the missing metrics.
+    :param cls:
+    :param vector_string:
+    :return: CacheKey, None if the vector string has an unknown metric or value, or is rejected by
+    cls.check_vector_string, like cls.from_vector_string would
+    """
+    try:
+        cls.check_vector_string(AbcCvss.as_vector_str(vector_string))
+        values = cls.parse_vector_string(vector_string)
+    except ValueError:
+        return None
+    version = values.pop('CVSS', '2.0')
+    layout = cls.metric_layout()
+    known = {metric.key: {member.value[1] for member in metric.members} for metric in layout}
+    for key, value in values.items():
+        if value not in known.get(key, ()):
+            return None
+    if any(metric.is_base and metric.key not in values for metric in layout):
+        return None
+    return _key(cls, version, values)
+
+
+def cache_key_of(cvss: AbcCvss) -> CacheKey:
+    values = {metric.key: getattr(cvss, metric.name).value[1] for metric in cvss.metric_layout()}
+    return _key(type(cvss), str(cvss.version), values)
+
+
+def cached_score_of(cvss: AbcCvss) -> CachedScore:
+    env_score = cvss.get_env_score()
+    return CachedScore(float(cvss.get_base_score()),
+                       float(cvss.get_temporal_score()),
+                       None if env_score is None else float(env_score),
+                       str(cvss.get_base_severity()))
+
+
+class ScoreCache:
+    """
+    Persistent cache of scores in a SQLite file, shared by the processes of a pipeline.
+    The database is in WAL mode so readers do not block each other, and reads do not write: the last use of the
+    entries read is kept in memory and written every flush_size entries, before an eviction and on close.
+    Its size is bounded by max_entries: when it grows beyond, the least recently used entries are deleted down to
+    90% of max_entries. The entries are counted on open, the count is then kept up to date with the entries this
+    cache writes, and only checked again when it is above max_entries, since other processes write too.
+    """
+
+    def __init__(self, path: str, max_entries: int = 1_000_000, flush_size: int = 100_000):
+        self.path = path
+        self.max_entries = max_entries
+        self.flush_size = flush_size
+        self._connection = sqlite3.connect(path)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        if self._connection.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+            with self._connection:
+                self._connection.execute('DROP TABLE IF EXISTS scores')
+                self._connection.executescript(SCHEMA)
+                self._connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self._count = len(self)
+        self._used: dict[CacheKey, int] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.flush()
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute('SELECT COUNT(*) FROM scores').fetchone()[0]
+
+    def get_many(self, keys: Iterable[CacheKey]) -> dict[CacheKey, CachedScore]:
+        """
+        Read the cached scores of keys, LOOKUP_SIZE keys per query, the keys not in the cache are missing from the
+        result.
+        :param keys:
+        :return: dict
+        """
+        keys = list(set(keys))
+        found = {}
+        for start in range(0, len(keys), LOOKUP_SIZE):
+            chunk = keys[start:start + LOOKUP_SIZE]
+            rows = self._connection.execute(
+                'SELECT class, version, vector, profile, base_score, temporal_score, env_score, severity '
+                'FROM scores WHERE (class, version, vector, profile) IN '
+                f'(VALUES {", ".join(["(?, ?, ?, ?)"] * len(chunk))})',
+                [value for key in chunk for value in key]).fetchall()
+            found.update((CacheKey(*row[:4]), CachedScore(*row[4:])) for row in rows)
+        now = time.time_ns()
+        self._used.update(dict.fromkeys(found, now))
+        if len(self._used) >= self.flush_size:
+            self.flush()
+        return found
+
+    def flush(self) -> None:
+        """
+        Write the last use of the entries read since the previous flush.
+        :return: None
+        """
+        if self._used:
+            with self._connection:
+                self._connection.executemany(
+                    'UPDATE scores SET last_used = ? WHERE class = ? AND version = ? AND vector = ? AND profile = ?',
+                    ((used,) + key for key, used in self._used.items()))
+            self._used.clear()
+
+    def put_many(self, scores: dict[CacheKey, CachedScore]) -> None:
+        now = time.time_ns()
+        with self._connection:
+            # The scores of a key never change, an entry written by another process meanwhile is kept.
+            inserted = self._connection.executemany(
+                'INSERT OR IGNORE INTO scores VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key + score + (now,) for key, score in scores.items())).rowcount
+        self._count += inserted
+        if self._count > self.max_entries:
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Delete the least recently used entries down to 90% of max_entries, when there are more than max_entries.
+        :return: None
+        """
+        self.flush()
+        self._count = len(self)
+        if self._count <= self.max_entries:
+            return
+        excess = self._count - (self.max_entries - self.max_entries // 10)
+        with self._connection:
+            self._connection.execute(
+                'DELETE FROM scores WHERE (class, version, vector, profile) IN '
+                '(SELECT class, version, vector, profile FROM scores ORDER BY last_used LIMIT ?)', (excess,))
+        self._count -= excess
+
+    def score_vector_strings(self, cls: type[AbcCvss], values: list[str]) -> list[CachedScore]:
+        """
+        Scores of vector strings, read from the cache when present, otherwise computed and written to the cache.
+        :param cls: The CVSS class used to parse the vector strings
+        :param values:
+        :return: list
+        """
+        keys = {value: cache_key(cls, value) for value in set(values)}
+        found = self.get_many(key for key in keys.values() if key is not None)
+        computed = {}
+        for value, key in keys.items():
+            if key is None or key not in found:
+                cvss = cls.from_vector_string(value)
+                key = cache_key_of(cvss)
+                keys[value] = key
+                computed[key] = cached_score_of(cvss)
+        if computed:
+            self.put_many(computed)
+            found.update(computed)
+        return [found[keys[value]] for value in values]
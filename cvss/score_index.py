@@ -0,0 +1,114 @@
+from functools import lru_cache
+from itertools import product
+from typing import Iterable
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss, CvssSeverity, CvssVersion, _VERSIONS, _restore_cvss
+from cvss.score_tables import get_score_table
+
+
+class ScoreIndex:
+    """
+    Inverse index of the base score: every base vector of a CVSS class, grouped by score and by severity.
+    The base vectors are returned as packed codes, see AbcCvss.to_packed, with the other metrics left not defined.
+    Use get_score_index to share one index per (class, version).
+    """
+
+    def __init__(self, cls: type[AbcCvss], version: CvssVersion):
+        self.cls = cls
+        self.version = version
+        self.base_metrics = tuple(metric for metric in cls.metric_layout() if metric.is_base)
+        self.base_mask = sum(metric.mask << metric.shift for metric in self.base_metrics)
+        metric_codes = np.array(list(product(*(range(len(metric.members)) for metric in self.base_metrics))),
+                                dtype=np.uint8)
+        defaults = sum(metric.code_of(metric.default) << metric.shift
+                       for metric in cls.metric_layout() if not metric.is_base)
+        codes = np.full(len(metric_codes), defaults, dtype=np.uint64)
+        for column, metric in enumerate(self.base_metrics):
+            codes |= metric_codes[:, column].astype(np.uint64) << np.uint64(metric.shift)
+        # The base scores come from the precomputed tables, in the same order as product.
+        tenths = get_score_table(cls, version).base_tenths.astype(np.int16)
+        severities = {value: CvssSeverity.from_float(value / 10) for value in np.unique(tenths).tolist()}
+
+        order = np.argsort(tenths, kind='stable')
+        self._metric_codes = metric_codes
+        self._codes = codes
+        self._tenths = tenths
+        self._sorted_codes = codes[order]
+        self._sorted_tenths = tenths[order]
+        self._by_severity = {
+            severity: codes[np.isin(tenths, [value for value, s in severities.items() if s is severity])]
+            for severity in CvssSeverity}
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def with_score(self, score: float) -> np.ndarray:
+        """
+        Base vectors whose base score is exactly score.
+        :param score:
+        :return: np.ndarray of packed codes
+        """
+        return self.with_score_between(score, score)
+
+    def with_score_between(self, low: float, high: float) -> np.ndarray:
+        """
+        Base vectors whose base score is between low and high, both included.
+        :param low:
+        :param high:
+        :return: np.ndarray of packed codes
+        """
+        start = np.searchsorted(self._sorted_tenths, round(low * 10), side='left')
+        end = np.searchsorted(self._sorted_tenths, round(high * 10), side='right')
+        return self._sorted_codes[start:end]
+
+    def with_severity(self, severity: CvssSeverity) -> np.ndarray:
+        return self._by_severity[severity]
+
+    def nearest_below(self, cvss: AbcCvss, threshold: float,
+                      allowed: Iterable[str] | None = None, max_changes: int | None = None) -> np.ndarray:
+        """
+        Base vectors scoring strictly below threshold that can be reached from cvss by changing base metrics.
+        The result is ordered by number of changed metrics, then by highest score, so the first code is the
+        smallest change lowering the score the least.
+        :param cvss: The vector to start from, its class should be the class of the index
+        :param threshold:
+        :param allowed: Names of the base metrics that may change, example ['attack_vector', 'privileges_required'].
+        All base metrics by default.
+        :param max_changes: Maximum number of metrics changed, unlimited by default
+        :return: np.ndarray of packed codes
+        """
+        current = np.array([metric.code_of(getattr(cvss, metric.name)) for metric in self.base_metrics],
+                           dtype=np.uint8)
+        changed = self._metric_codes != current
+        candidates = self._tenths < round(threshold * 10)
+        if allowed is not None:
+            allowed = set(allowed)
+            locked = [column for column, metric in enumerate(self.base_metrics) if metric.name not in allowed]
+            candidates &= ~changed[:, locked].any(axis=1)
+        changes = changed.sum(axis=1)
+        if max_changes is not None:
+            candidates &= changes <= max_changes
+        rows = np.flatnonzero(candidates)
+        order = np.lexsort((-self._tenths[rows], changes[rows]))
+        return self._codes[rows[order]]
+
+    def to_objects(self, codes: Iterable[int], template: AbcCvss | None = None) -> list[AbcCvss]:
+        """
+        Build the CVSS objects of base codes returned by the index.
+        :param codes:
+        :param template: If given, the non base metrics (temporal and environmental) are copied from it
+        :return: list
+        """
+        version_tag = _VERSIONS.index(self.version)
+        codes = np.asarray(codes).tolist()
+        if template is not None:
+            other_metrics = template.to_packed() & ~self.base_mask
+            codes = [(code & self.base_mask) | other_metrics for code in codes]
+        return [_restore_cvss(self.cls, version_tag, code) for code in codes]
+
+
+@lru_cache(maxsize=None)
+def get_score_index(cls: type[AbcCvss], version: CvssVersion) -> ScoreIndex:
+    return ScoreIndex(cls, version)
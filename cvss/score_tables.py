@@ -0,0 +1,230 @@
+import argparse
+import dis
+import hashlib
+import json
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss, CvssVersion
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v30 import CvssV30
+from cvss.cvss_v31 import CvssV31
+from cvss.env_profile import _dense_index
+
+ARTIFACT_PATH = os.path.join(os.path.dirname(__file__), 'data', 'score_tables.bin')
+MAGIC = b'CVSSTBL\0'
+FORMAT_VERSION = 1
+# Classes and versions shipped in the artifact, CvssV31 also parses v3.0 vector strings.
+TABLE_KINDS: tuple[tuple[type[AbcCvss], CvssVersion], ...] = (
+    (CvssV2, CvssVersion.CVSS_V2), (CvssV30, CvssVersion.CVSS_V30),
+    (CvssV31, CvssVersion.CVSS_V30), (CvssV31, CvssVersion.CVSS_V31))
+# Methods the base and temporal scores depend on, a change of their code makes the artifact stale.
+SCORE_METHODS = ('_compute_base_score', '_compute_impact_score', '_compute_exploitability_score', '_compute_isc',
+                 '_f', '_compute_temporal_score', 'roundup', 'round_to_one_decimal')
+
+
+def _class_name(cls: type) -> str:
+    return f'{cls.__module__}.{cls.__qualname__}'
+
+
+@dataclass(frozen=True)
+class ScoreTable:
+    """
+    Base and temporal scores of every vector of a CVSS class and version, in tenths of score.
+    base_tenths has a row per base vector, in the dense order of the base metrics (the first metric varies the
+    slowest). The temporal score only depends on the base score and the temporal metrics, temporal_tenths has a
+    row per base score in tenths and a column per temporal vector.
+    """
+    cls: type[AbcCvss]
+    version: CvssVersion
+    base_tenths: np.ndarray
+    temporal_tenths: np.ndarray
+
+    def _metrics(self, group: str) -> list:
+        return [metric for metric in self.cls.metric_layout() if metric.group == group]
+
+    def base_scores(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Base scores of packed codes, see AbcCvss.to_packed.
+        :param codes:
+        :return: np.ndarray
+        """
+        codes = np.asarray(codes, dtype=np.uint64)
+        return self.base_tenths[_dense_index(self._metrics('base'), codes)] / 10
+
+    def temporal_scores(self, codes: np.ndarray) -> np.ndarray:
+        codes = np.asarray(codes, dtype=np.uint64)
+        base = self.base_tenths[_dense_index(self._metrics('base'), codes)]
+        return self.temporal_tenths[base, _dense_index(self._metrics('temporal'), codes)] / 10
+
+
+def build_table(cls: type[AbcCvss], version: CvssVersion) -> ScoreTable:
+    """
+    Compute a ScoreTable with the formulas of cls, on a single object whose metrics are changed in place.
+    :param cls:
+    :param version:
+    :return: ScoreTable
+    """
+    layout = cls.metric_layout()
+    template = cls.from_packed(0, version)
+    base_tenths = []
+    for members in product(*(metric.members for metric in layout if metric.group == 'base')):
+        for metric, member in zip((metric for metric in layout if metric.group == 'base'), members):
+            setattr(template, metric.name, member)
+        base_tenths.append(round(template._compute_base_score() * 10))
+    temporal = [metric for metric in layout if metric.group == 'temporal']
+    temporal_tenths = np.zeros((101, int(np.prod([len(metric.members) for metric in temporal]))), dtype=np.uint8)
+    for tenths in range(101):
+        template._base_score = tenths / 10
+        for column, members in enumerate(product(*(metric.members for metric in temporal))):
+            for metric, member in zip(temporal, members):
+                setattr(template, metric.name, member)
+            temporal_tenths[tenths, column] = round(template._compute_temporal_score() * 10)
+    return ScoreTable(cls, version, np.array(base_tenths, dtype=np.uint8), temporal_tenths)
+
+
+def _code_signature(code) -> list:
+    """
+    Instructions of a code object and of the code objects nested in it, in order, with the value of their argument
+    (constants, attribute and global names, local variables) instead of its index. Line numbers and the docstring
+    are left out. The bytecode depends on the Python version, the artifact is stale for another version.
+    """
+    signature = []
+    for instruction in dis.get_instructions(code):
+        if hasattr(instruction.argval, 'co_code'):
+            signature.append((instruction.opname, _code_signature(instruction.argval)))
+        else:
+            signature.append((instruction.opname, instruction.argval))
+    return signature
+
+
+def fingerprint(kinds: tuple[tuple[type[AbcCvss], CvssVersion], ...] = TABLE_KINDS) -> str:
+    """
+    Hash of everything the tables depend on: the metric weights and the bytecode of the score methods, with their
+    constants, operators and the names they use. Comments, docstrings and formatting of the methods do not change it.
+    :param kinds:
+    :return: str
+    """
+    digest = hashlib.sha256()
+    for cls, version in kinds:
+        digest.update(f'{_class_name(cls)} {version}'.encode())
+        for metric in cls.metric_layout():
+            digest.update(repr([member.value for member in metric.members]).encode())
+        for name in SCORE_METHODS:
+            method = getattr(cls, name, None)
+            code = getattr(getattr(method, '__func__', method), '__code__', None)
+            digest.update(f'{name} {_code_signature(code) if code is not None else None}'.encode())
+    return digest.hexdigest()
+
+
+def write_tables(path: str, tables: list[ScoreTable]) -> None:
+    """
+    Write the artifact: the magic, the length of a JSON header, the header, then the tables aligned on 8 bytes.
+    The header holds the format version, the fingerprint, the sha256 of the payload and the position of each table.
+    :param path:
+    :param tables:
+    :return: None
+    """
+    payload = bytearray()
+    entries = []
+    for table in tables:
+        entry = {'class': _class_name(table.cls), 'version': str(table.version)}
+        for name in ('base_tenths', 'temporal_tenths'):
+            array = np.ascontiguousarray(getattr(table, name), dtype=np.uint8)
+            entry[name] = [len(payload), list(array.shape)]
+            payload += array.tobytes()
+            payload += b'\0' * (-len(payload) % 8)
+        entries.append(entry)
+    header = json.dumps({'format': FORMAT_VERSION,
+                         'fingerprint': fingerprint(tuple((table.cls, table.version) for table in tables)),
+                         'sha256': hashlib.sha256(payload).hexdigest(),
+                         'tables': entries}).encode()
+    header += b' ' * (-(len(MAGIC) + 4 + len(header)) % 8)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temporary = f'{path}.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(MAGIC + struct.pack('<I', len(header)) + header + payload)
+    os.replace(temporary, path)
+
+
+def read_tables(path: str, verify: bool = True) -> dict[tuple[str, CvssVersion], ScoreTable]:
+    """
+    Map the artifact in memory, the tables are read-only views on the mapping, shared by every process through
+    the page cache.
+    :param path:
+    :param verify: Check the sha256 of the payload
+    :return: The tables by (class name, version)
+    :raise ValueError: The artifact is not a score table file, has another format, is stale or corrupted
+    """
+    with open(path, 'rb') as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if mapping[:len(MAGIC)] != MAGIC:
+        raise ValueError(f'{path} is not a score table file')
+    header_length, = struct.unpack_from('<I', mapping, len(MAGIC))
+    start = len(MAGIC) + 4 + header_length
+    header = json.loads(mapping[len(MAGIC) + 4:start])
+    if header['format'] != FORMAT_VERSION:
+        raise ValueError(f'Unsupported score table format {header["format"]}')
+    if verify and hashlib.sha256(memoryview(mapping)[start:]).hexdigest() != header['sha256']:
+        raise ValueError(f'{path} is corrupted')
+    classes = {_class_name(cls): cls for cls, _ in TABLE_KINDS}
+    kinds = tuple((classes.get(entry['class']), CvssVersion.from_str(entry['version'])) for entry in header['tables'])
+    if any(cls is None for cls, _ in kinds) or header['fingerprint'] != fingerprint(kinds):
+        raise ValueError(f'{path} is stale')
+    tables = {}
+    for (cls, version), entry in zip(kinds, header['tables']):
+        arrays = []
+        for name in ('base_tenths', 'temporal_tenths'):
+            offset, shape = entry[name]
+            arrays.append(np.frombuffer(mapping, dtype=np.uint8, count=int(np.prod(shape)),
+                                        offset=start + offset).reshape(shape))
+        tables[(entry['class'], version)] = ScoreTable(cls, version, *arrays)
+    return tables
+
+
+def _load_tables(path: str) -> dict[tuple[str, CvssVersion], ScoreTable]:
+    """
+    Same as read_tables, but a missing, stale or malformed artifact gives no table instead of an error.
+    """
+    try:
+        return read_tables(path)
+    except (OSError, ValueError, KeyError, IndexError, TypeError, struct.error):
+        return {}
+
+
+@lru_cache(maxsize=1)
+def _shipped_tables() -> dict[tuple[str, CvssVersion], ScoreTable]:
+    return _load_tables(ARTIFACT_PATH)
+
+
+@lru_cache(maxsize=None)
+def get_score_table(cls: type[AbcCvss], version: CvssVersion) -> ScoreTable:
+    """
+    ScoreTable of a class and version, mapped from the artifact shipped with the package on first use.
+    It is computed again if the artifact is missing or stale, or if the class is not in it.
+    :param cls:
+    :param version:
+    :return: ScoreTable
+    """
+    table = _shipped_tables().get((_class_name(cls), version))
+    return table if table is not None else build_table(cls, version)
+
+
+def build_artifact(path: str = ARTIFACT_PATH) -> None:
+    write_tables(path, [build_table(cls, version) for cls, version in TABLE_KINDS])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Build the score table artifact shipped with the package')
+    parser.add_argument('path', nargs='?', default=ARTIFACT_PATH)
+    build_artifact(parser.parse_args().path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss, AbcVector, CvssVersion
+from cvss.codec import score_codes
+
+
+@dataclass
+class Sensitivity:
+    """
+    Score change of every vector when one metric is set to another value.
+    Row i is the i-th vector, column j is alternatives[j]. The delta of the current value of a metric is 0.
+    """
+    alternatives: list[tuple[str, AbcVector]]
+    base_deltas: np.ndarray
+    env_deltas: np.ndarray
+
+    def column(self, metric: str, value: AbcVector) -> int:
+        return self.alternatives.index((metric, value))
+
+
+def metric_sensitivity(cls: type[AbcCvss], version: CvssVersion, codes: Iterable[int],
+                       metrics: Iterable[str] | None = None) -> Sensitivity:
+    """
+    Compute the sensitivity of packed codes, see AbcCvss.to_packed.
+    The codes and their neighbours are scored with table lookups, see score_codes, whatever the number of rows.
+    :param cls:
+    :param version:
+    :param codes:
+    :param metrics: Names of the metrics to flip, the base metrics by default
+    :return: Sensitivity
+    """
+    layout = cls.metric_layout()
+    if metrics is None:
+        flipped = [metric for metric in layout if metric.is_base]
+    else:
+        by_name = {metric.name: metric for metric in layout}
+        flipped = [by_name[name] for name in metrics]
+    alternatives = [(metric.name, member) for metric in flipped for member in metric.members]
+
+    unique, inverse = np.unique(np.fromiter(codes, dtype=np.uint64), return_inverse=True)
+    neighbours = np.empty((len(unique), len(alternatives)), dtype=np.uint64)
+    column = 0
+    for metric in flipped:
+        cleared = unique & ~np.uint64(metric.mask << metric.shift)
+        for index in range(len(metric.members)):
+            neighbours[:, column] = cleared | np.uint64(index << metric.shift)
+            column += 1
+
+    base, _, env = score_codes(cls, version, unique)
+    neighbour_base, _, neighbour_env = score_codes(cls, version, neighbours.reshape(-1))
+    base_deltas = neighbour_base.reshape(neighbours.shape) - base[:, None]
+    env_deltas = neighbour_env.reshape(neighbours.shape) - env[:, None]
+    inverse = inverse.reshape(-1)
+    return Sensitivity(alternatives=alternatives, base_deltas=base_deltas[inverse], env_deltas=env_deltas[inverse])
+
+
+def sensitivity_of(objects: list[AbcCvss], metrics: Iterable[str] | None = None) -> Sensitivity:
+    """
+    Same as metric_sensitivity for CVSS objects, they must all have the same class and version.
+    :param objects:
+    :param metrics:
+    :return: Sensitivity
+    """
+    kinds = {(type(cvss), cvss.version) for cvss in objects}
+    if len(kinds) != 1:
+        raise ValueError(f'Expected objects of a single class and version, got {len(kinds)}')
+    cls, version = kinds.pop()
+    return metric_sensitivity(cls, version, (cvss.to_packed() for cvss in objects), metrics)
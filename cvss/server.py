@@ -0,0 +1,315 @@
+import argparse
+import asyncio
+import json
+import time
+from functools import lru_cache
+
+from abs.exceptions import CvssError
+from cvss.dispatch import parse_any
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large',
+           500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+class Overloaded(Exception):
+    pass
+
+
+class ScoringEngine:
+    """
+    Score vector strings, each distinct vector string is parsed and scored once for the life of the engine.
+    """
+
+    def __init__(self, cache_size: int = 65536):
+        self.score_one = lru_cache(maxsize=cache_size)(self._score_one)
+
+    @staticmethod
+    def _score_one(vector_string: str) -> dict:
+        try:
+            cvss = parse_any(vector_string)
+        except CvssError:
+            return {'vectorString': vector_string, 'error': 'Invalid vector string'}
+        return {
+            'vectorString': vector_string,
+            'version': str(cvss.version),
+            'baseScore': float(cvss.get_base_score()),
+            'baseSeverity': str(cvss.get_base_severity()),
+            'temporalScore': float(cvss.get_temporal_score()),
+            'envScore': None if cvss.get_env_score() is None else float(cvss.get_env_score())
+        }
+
+    def score(self, vector_strings: list[str]) -> list[dict]:
+        return [self.score_one(vector_string) for vector_string in vector_strings]
+
+
+class MicroBatcher:
+    """
+    Coalesce the vectors submitted by concurrent requests into batches of at most max_batch_size vectors, waiting
+    at most max_wait seconds after the first vector of a batch. When max_pending vectors are already waiting,
+    submit raises Overloaded instead of queueing more work. submit_many queues all the vectors of a request or none.
+    """
+
+    def __init__(self, engine: ScoringEngine, max_batch_size: int = 256, max_wait: float = 0.002,
+                 max_pending: int = 10000):
+        self.engine = engine
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._task: asyncio.Task | None = None
+        self.batches = 0
+        self.vectors = 0
+        self.rejected = 0
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, vector_string: str) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((vector_string, future))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise Overloaded
+        return future
+
+    def submit_many(self, vector_strings: list[str]) -> list[asyncio.Future]:
+        if self._queue.maxsize > 0 and len(vector_strings) > self._queue.maxsize - self.pending:
+            self.rejected += len(vector_strings)
+            raise Overloaded
+        return [self.submit(vector_string) for vector_string in vector_strings]
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self._queue.get_nowait())
+            # A failing batch fails its own requests only, the loop keeps serving the next batches.
+            try:
+                results = self.engine.score([vector_string for vector_string, _ in batch])
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+            else:
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+            self.batches += 1
+            self.vectors += len(batch)
+
+
+class ScoringServer:
+    """
+    Minimal HTTP/1.1 server with keep-alive.
+    POST /score with {"vector": "..."} or {"vectors": [...]}, GET /health and GET /metrics.
+    A request whose body is larger than max_body_size bytes is answered with 413 and its connection closed.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8080, max_batch_size: int = 256,
+                 max_wait: float = 0.002, max_pending: int = 10000, cache_size: int = 65536,
+                 max_body_size: int = 1 << 20):
+        self.host = host
+        self.port = port
+        self.max_body_size = max_body_size
+        self.engine = ScoringEngine(cache_size)
+        self._batcher_options = dict(max_batch_size=max_batch_size, max_wait=max_wait, max_pending=max_pending)
+        self.batcher: MicroBatcher | None = None
+        self._server: asyncio.Server | None = None
+        self._started = time.monotonic()
+        self.requests = 0
+        self.latency_total = 0.0
+
+    async def start(self) -> None:
+        self.batcher = MicroBatcher(self.engine, **self._batcher_options)
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+        await self.batcher.stop()
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def metrics(self) -> dict:
+        cache = self.engine.score_one.cache_info()
+        return {
+            'uptime': time.monotonic() - self._started,
+            'requests': self.requests,
+            'meanLatencyMs': self.latency_total * 1000 / self.requests if self.requests else 0.0,
+            'vectors': self.batcher.vectors,
+            'batches': self.batcher.batches,
+            'meanBatchSize': self.batcher.vectors / self.batcher.batches if self.batcher.batches else 0.0,
+            'pending': self.batcher.pending,
+            'rejected': self.batcher.rejected,
+            'cacheHits': cache.hits,
+            'cacheMisses': cache.misses
+        }
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                request_line = lines[0].split(' ', 2)
+                if len(request_line) != 3:
+                    break
+                method, path, http_version = request_line
+                headers = {}
+                for line in lines[1:]:
+                    if line:
+                        key, _, value = line.partition(':')
+                        headers[key.strip().lower()] = value.strip()
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection == 'keep-alive' if http_version == 'HTTP/1.0' else connection != 'close'
+                # The body of a rejected request is not read, the connection cannot be reused.
+                length = headers.get('content-length', '0')
+                if not (length.isascii() and length.isdigit()):
+                    status, payload, keep_alive = 400, {'error': 'Invalid Content-Length'}, False
+                elif int(length) > self.max_body_size:
+                    status, payload, keep_alive = 413, {'error': f'Body larger than {self.max_body_size} bytes'}, False
+                else:
+                    try:
+                        body = await reader.readexactly(int(length))
+                    except (asyncio.IncompleteReadError, ConnectionError):
+                        break
+                    start = time.perf_counter()
+                    status, payload = await self._route(method, path, body)
+                    self.requests += 1
+                    self.latency_total += time.perf_counter() - start
+
+                data = json.dumps(payload).encode()
+                writer.write(f'{http_version} {status} {REASONS[status]}\r\n'
+                             f'Content-Type: application/json\r\n'
+                             f'Content-Length: {len(data)}\r\n'
+                             f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'.encode() + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes) -> tuple[int, dict | list]:
+        if path == '/health':
+            return 200, {'status': 'ok'}
+        if path == '/metrics':
+            return 200, self.metrics()
+        if path != '/score':
+            return 404, {'error': 'Not found'}
+        if method != 'POST':
+            return 405, {'error': 'Use POST'}
+        try:
+            request = json.loads(body)
+        except ValueError:
+            request = None
+        if isinstance(request, dict) and 'vector' in request:
+            vectors = [request['vector']]
+        elif isinstance(request, dict) and isinstance(request.get('vectors'), list):
+            vectors = request['vectors']
+        else:
+            return 400, {'error': 'Expected {"vector": ...} or {"vectors": [...]}'}
+        if not all(isinstance(vector, str) for vector in vectors):
+            return 400, {'error': 'Vectors should be strings'}
+        try:
+            futures = self.batcher.submit_many(vectors)
+        except Overloaded:
+            return 503, {'error': 'Too many pending vectors'}
+        try:
+            results = await asyncio.gather(*futures)
+        except Exception:
+            return 500, {'error': 'Scoring failed'}
+        return 200, results[0] if 'vector' in request else results
+
+
+async def _bench_client(port: int, vectors: list[str], count: int, latencies: list[float]) -> None:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    for i in range(count):
+        body = json.dumps({'vector': vectors[i % len(vectors)]}).encode()
+        start = time.perf_counter()
+        writer.write(b'POST /score HTTP/1.1\r\nHost: localhost\r\nContent-Length: %d\r\n\r\n' % len(body) + body)
+        await writer.drain()
+        head = await reader.readuntil(b'\r\n\r\n')
+        length = int(head.lower().split(b'content-length:')[1].split(b'\r\n')[0])
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def bench(concurrency: int = 64, requests: int = 20000, **options) -> dict:
+    """
+    Start a server and measure its latency and throughput with keep-alive clients sending one vector per request.
+    """
+    server = ScoringServer(port=0, **options)
+    await server.start()
+    vectors = ["CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H",
+               "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H/MAV:P",
+               "AV:N/AC:L/Au:N/C:N/I:N/A:P"]
+    latencies: list[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(_bench_client(server.port, vectors, requests // concurrency, latencies)
+                           for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    metrics = server.metrics()
+    await server.stop()
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'throughput': len(latencies) / elapsed,
+        'p50Ms': latencies[len(latencies) // 2] * 1000,
+        'p99Ms': latencies[int(len(latencies) * 0.99)] * 1000,
+        'meanBatchSize': metrics['meanBatchSize']
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='CVSS scoring service')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--max-batch-size', type=int, default=256)
+    parser.add_argument('--max-wait-ms', type=float, default=2.0)
+    parser.add_argument('--max-pending', type=int, default=10000)
+    parser.add_argument('--max-body-size', type=int, default=1 << 20)
+    parser.add_argument('--bench', action='store_true', help='Run the latency/throughput self-benchmark')
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--requests', type=int, default=20000)
+    args = parser.parse_args()
+    options = dict(max_batch_size=args.max_batch_size, max_wait=args.max_wait_ms / 1000, max_pending=args.max_pending,
+                   max_body_size=args.max_body_size)
+    if args.bench:
+        print(json.dumps(asyncio.run(bench(args.concurrency, args.requests, **options)), indent=2))
+    else:
+        asyncio.run(ScoringServer(args.host, args.port, **options).serve_forever())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+import csv
+import json
+import os
+import pickle
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing.context import BaseContext
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss, CvssSeverity, _VERSIONS, _restore_cvss
+from abs.exceptions import CvssError
+from cvss.intern_table import VectorInternTable
+from cvss.top_k import SCORES, TopK
+
+# Histogram bins: one per tenth of score, from 0.0 to 10.0.
+HISTOGRAM_BINS = 101
+
+
+def shard_of(cve_id: str, shard_count: int) -> int:
+    """
+    Shard of a CVE id, the same on every host and every run.
+    :param cve_id:
+    :param shard_count:
+    :return: int
+    """
+    return zlib.crc32(cve_id.encode()) % shard_count
+
+
+def read_records(path: str) -> Iterator[tuple[str | None, str | None]]:
+    """
+    Read (CVE id, vector string) records from a JSONL file with lines like {"id": "...", "vectorString": "..."}
+    or from a CSV file with a header like "id,vectorString". A numeric id is read as a string.
+    :param path:
+    :return: Iterator, with None for the id or the vector string missing from a record
+    """
+    with open(path, newline='') as f:
+        if path.endswith('.csv'):
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+        for row in rows:
+            if not isinstance(row, dict):
+                row = {}
+            cve_id = row.get('id')
+            yield None if cve_id is None else str(cve_id), row.get('vectorString')
+
+
+def shard_path(directory: str, shard: int) -> str:
+    return os.path.join(directory, f'shard-{shard:05}')
+
+
+def partition_files(paths: Iterable[str], shard_count: int, directory: str, prefix: str = 'part',
+                    buffer_size: int = 1 << 24) -> list[str]:
+    """
+    Split the records of paths into one directory per shard, in a single pass. Every host can partition its own files
+    in a shared directory with its own prefix, the records of a shard are then read in the order of the file names.
+    The records are buffered per shard and appended to the shard files every buffer_size characters, so a single
+    file is open at a time whatever the number of shards.
+    :param paths:
+    :param shard_count:
+    :param directory:
+    :param prefix:
+    :param buffer_size: Number of characters buffered before writing
+    :return: The shard directories
+    """
+    directories = [shard_path(directory, shard) for shard in range(shard_count)]
+    names = []
+    for shard_directory in directories:
+        os.makedirs(shard_directory, exist_ok=True)
+        names.append(os.path.join(shard_directory, f'{prefix}.jsonl'))
+        open(names[-1], 'w').close()
+    buffers: list[list[str]] = [[] for _ in range(shard_count)]
+
+    def flush() -> None:
+        for name, lines in zip(names, buffers):
+            if lines:
+                with open(name, 'a') as f:
+                    f.write(''.join(lines))
+                lines.clear()
+
+    buffered = 0
+    for path in paths:
+        for cve_id, vector in read_records(path):
+            line = json.dumps({'id': cve_id, 'vectorString': vector}) + '\n'
+            buffers[shard_of(cve_id or '', shard_count)].append(line)
+            buffered += len(line)
+            if buffered >= buffer_size:
+                flush()
+                buffered = 0
+    flush()
+    return directories
+
+
+def shard_files(shard_directory: str) -> list[str]:
+    return [os.path.join(shard_directory, name) for name in sorted(os.listdir(shard_directory))
+            if name.endswith('.jsonl')]
+
+
+@dataclass
+class PartialResult:
+    """
+    Aggregates of a part of a corpus. Partial results of disjoint sets of CVE ids can be merged in any order, the
+    finalized result is the same whatever the sharding.
+    """
+    k: int = 10
+    score: str = 'base'
+    count: int = 0
+    invalid: int = 0
+    severity_counts: Counter = field(default_factory=Counter)
+    histogram: np.ndarray = field(default_factory=lambda: np.zeros(HISTOGRAM_BINS, dtype=np.int64))
+    top_k: TopK | None = None
+    vectors: Counter = field(default_factory=Counter)
+
+    def __post_init__(self):
+        if self.top_k is None:
+            self.top_k = TopK(self.k, self.score)
+
+    def add(self, cve_id: str, cvss: AbcCvss) -> None:
+        """
+        Add a scored record, grouped by CVSS version in the top k.
+        :param cve_id:
+        :param cvss:
+        :return: None
+        """
+        self.add_key(cve_id, VectorInternTable.key_of(cvss), self.score_of(cvss))
+
+    def score_of(self, cvss: AbcCvss) -> float | None:
+        return (cvss.get_base_score, cvss.get_temporal_score, cvss.get_env_score)[SCORES.index(self.score)]()
+
+    def add_key(self, cve_id: str, key: tuple[type, int, int], score: float | None) -> None:
+        """
+        Same as add with the key of the vector, see VectorInternTable.key_of, and its score, see score_of.
+        """
+        self.count += 1
+        self.vectors[key] += 1
+        if score is None:
+            return
+        self.severity_counts[CvssSeverity.from_float(score).value] += 1
+        self.histogram[int(round(score * 10))] += 1
+        self.top_k.push(_VERSIONS[key[1]].value, score, cve_id)
+
+    def merge(self, other: 'PartialResult') -> None:
+        if (other.k, other.score) != (self.k, self.score):
+            raise ValueError('Only partial results with the same k and score can be merged')
+        self.count += other.count
+        self.invalid += other.invalid
+        self.severity_counts.update(other.severity_counts)
+        self.histogram += other.histogram
+        self.top_k.merge(other.top_k)
+        self.vectors.update(other.vectors)
+
+    def metric_counts(self) -> dict[str, Counter]:
+        """
+        Distribution of every metric: the number of records of each value, by vector string key and value char.
+        Example: {'AV': Counter({'N': 12, 'L': 3}), ...}
+        :return: dict
+        """
+        counts: dict[str, Counter] = {}
+        for (cls, _, code), count in self.vectors.items():
+            for metric in cls.metric_layout():
+                member = metric.members[(code >> metric.shift) & metric.mask]
+                counts.setdefault(metric.key, Counter())[member.value[1]] += count
+        return counts
+
+    def finalize(self) -> dict:
+        """
+        Canonical form of the aggregates: every collection is sorted.
+        :return: dict
+        """
+        vectors = sorted((_restore_cvss(*key).get_vector_string(), count) for key, count in self.vectors.items())
+        return {
+            'count': self.count,
+            'invalid': self.invalid,
+            'severityCounts': dict(sorted(self.severity_counts.items())),
+            'histogram': self.histogram.tolist(),
+            'topK': dict(sorted(self.top_k.results().items())),
+            'vectors': vectors
+        }
+
+
+def process_records(cls: type[AbcCvss], records: Iterable[tuple[str, str]], k: int = 10,
+                    score: str = 'base') -> PartialResult:
+    """
+    Aggregate records, see read_records. When a CVE id appears several times, its last record is the one kept.
+    Each distinct vector string is parsed once, a vector string that can not be parsed and a record without id or
+    vector string are counted as invalid.
+    :param cls: The CVSS class used to parse the vector strings
+    :param records:
+    :param k:
+    :param score: 'base', 'temporal' or 'env'
+    :return: PartialResult
+    """
+    partial = PartialResult(k, score)
+    latest = {}
+    for cve_id, vector in records:
+        if isinstance(cve_id, str) and isinstance(vector, str):
+            latest[cve_id] = vector
+        else:
+            partial.invalid += 1
+    parsed: dict[str, AbcCvss | None] = {}
+    for cve_id, vector in latest.items():
+        if vector not in parsed:
+            try:
+                parsed[vector] = cls.from_vector_string(vector)
+            except CvssError:
+                parsed[vector] = None
+        cvss = parsed[vector]
+        if cvss is None:
+            partial.invalid += 1
+        else:
+            partial.add(cve_id, cvss)
+    return partial
+
+
+def process_shard(cls: type[AbcCvss], shard_directory: str, k: int = 10, score: str = 'base') -> PartialResult:
+    """
+    Aggregate every record of a shard directory written by partition_files.
+    """
+    records = (record for path in shard_files(shard_directory) for record in read_records(path))
+    return process_records(cls, records, k, score)
+
+
+def save_partial(partial: PartialResult, path: str) -> None:
+    """
+    Write a partial result, to merge it on another host with load_partial.
+    :param partial:
+    :param path:
+    :return: None
+    """
+    with open(path, 'wb') as f:
+        pickle.dump(partial, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_partial(path: str) -> PartialResult:
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def merge_partials(partials: Iterable[PartialResult]) -> PartialResult:
+    partials = iter(partials)
+    result = next(partials)
+    for partial in partials:
+        result.merge(partial)
+    return result
+
+
+def run_sharded(cls: type[AbcCvss], paths: Iterable[str], shard_count: int, directory: str,
+                workers: int | None = None, k: int = 10, score: str = 'base',
+                mp_context: BaseContext | None = None) -> dict:
+    """
+    Partition the records of paths, aggregate every shard in a process pool and merge the partial results.
+    :param cls: The CVSS class used to parse the vector strings
+    :param paths: JSONL or CSV files, see read_records
+    :param shard_count:
+    :param directory: Where the shards are written
+    :param workers: Number of processes, by default the number of CPUs
+    :param k:
+    :param score: 'base', 'temporal' or 'env'
+    :param mp_context: multiprocessing context of the pool, the default context of the platform by default
+    :return: dict, see PartialResult.finalize
+    """
+    directories = partition_files(paths, shard_count, directory)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+        partials = executor.map(process_shard, [cls] * shard_count, directories, [k] * shard_count,
+                                [score] * shard_count)
+        return merge_partials(partials).finalize()
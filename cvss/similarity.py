@@ -0,0 +1,141 @@
+from typing import Iterable
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss, MetricField
+
+DISTANCES = ('hamming', 'score')
+
+
+def metric_codes(metrics: Iterable[MetricField], codes: np.ndarray) -> np.ndarray:
+    """
+    Split packed codes, see AbcCvss.to_packed, into one column of member indexes per metric.
+    :param metrics:
+    :param codes:
+    :return: np.ndarray of shape (len(codes), len(metrics))
+    """
+    codes = np.asarray(codes, dtype=np.uint64)
+    return np.stack([((codes >> np.uint64(metric.shift)) & np.uint64(metric.mask)).astype(np.intp)
+                     for metric in metrics], axis=1)
+
+
+def metric_distances(metric: MetricField, distance: str = 'hamming', weight: float = 1.0) -> np.ndarray:
+    """
+    Distance between every pair of members of a metric.
+    'hamming' is weight when the members differ. 'score' is weight times the difference of their weights in the
+    score formulas (the to_float weight, the scope unchanged one for privileges required).
+    :param metric:
+    :param distance: 'hamming' or 'score'
+    :param weight:
+    :return: np.ndarray of shape (len(metric.members), len(metric.members))
+    """
+    if distance == 'hamming':
+        return weight * (1 - np.eye(len(metric.members)))
+    if distance == 'score':
+        values = np.array([member.value[2] for member in metric.members], dtype=float)
+        return weight * np.abs(values[:, None] - values[None, :])
+    raise ValueError(f'distance should be one of {DISTANCES}')
+
+
+class SimilarityIndex:
+    """
+    Nearest neighbours of vectors of a CVSS class, with a weighted per-metric distance: the sum over the metrics of
+    the distance between the members of the two vectors.
+    Distances are computed between distinct packed codes only, then expanded to the rows sharing them, so a query
+    costs the number of distinct vectors (at most 2592 base vectors for CVSS v3) whatever the number of rows.
+    Ties are ordered by row.
+    """
+
+    def __init__(self, cls: type[AbcCvss], codes: np.ndarray, metrics: Iterable[str] | None = None,
+                 weights: dict[str, float] | None = None, distance: str = 'hamming'):
+        """
+        :param cls:
+        :param codes: Packed codes of the rows, see AbcCvss.to_packed
+        :param metrics: Names of the metrics compared, the base metrics by default
+        :param weights: Weight of each metric name, 1 by default
+        :param distance: 'hamming' or 'score', see metric_distances
+        """
+        layout = {metric.name: metric for metric in cls.metric_layout()}
+        if metrics is None:
+            metrics = [metric.name for metric in layout.values() if metric.is_base]
+        weights = weights or {}
+        self.cls = cls
+        self.metrics = tuple(layout[name] for name in metrics)
+        self._tables = [metric_distances(metric, distance, weights.get(metric.name, 1.0)) for metric in self.metrics]
+        self.codes = np.asarray(codes, dtype=np.uint64)
+        self.unique_codes, inverse = np.unique(self.codes, return_inverse=True)
+        self.inverse = inverse.reshape(-1)
+        self._unique_metrics = metric_codes(self.metrics, self.unique_codes)
+        self._row_order = np.argsort(self.inverse, kind='stable')
+        self._bounds = np.searchsorted(self.inverse[self._row_order], np.arange(len(self.unique_codes) + 1))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def _code_of(self, value: AbcCvss | int) -> int:
+        return value.to_packed() if isinstance(value, AbcCvss) else int(value)
+
+    def distance(self, a: AbcCvss | int, b: AbcCvss | int) -> float:
+        columns = metric_codes(self.metrics, np.array([self._code_of(a), self._code_of(b)], dtype=np.uint64))
+        return float(sum(table[columns[0, m], columns[1, m]] for m, table in enumerate(self._tables)))
+
+    def _unique_distances(self, query_metrics: np.ndarray) -> np.ndarray:
+        """
+        Distances between queries given as metric columns and every distinct code, shape (queries, unique codes).
+        """
+        result = np.zeros((len(query_metrics), len(self.unique_codes)))
+        for m, table in enumerate(self._tables):
+            result += table[query_metrics[:, m][:, None], self._unique_metrics[:, m][None, :]]
+        return result
+
+    def _expand(self, distances: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The k closest rows from the distances to the distinct codes. The closest codes are taken until they have k
+        rows, with every code at the same distance as the last one so that ties are ordered by row. The rows of a
+        code are sorted, so only the first k rows of each code are merged.
+        """
+        k = min(k, len(self.codes))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        order = np.argsort(distances, kind='stable')
+        reached = np.searchsorted(np.cumsum(np.diff(self._bounds)[order]), k)
+        selected = order[distances[order] <= distances[order[reached]]]
+        rows = np.concatenate([self.rows_of(unique)[:k] for unique in selected.tolist()])
+        row_distances = np.repeat(distances[selected], np.minimum(np.diff(self._bounds)[selected], k))
+        order = np.lexsort((rows, row_distances))[:k]
+        return rows[order], row_distances[order]
+
+    def query(self, value: AbcCvss | int, k: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The k rows closest to value.
+        :param value: A CVSS object or a packed code
+        :param k:
+        :return: (rows, distances), closest first
+        """
+        return self.query_many([value], k)[0]
+
+    def query_many(self, values: Iterable[AbcCvss | int], k: int = 10) -> list[tuple[np.ndarray, np.ndarray]]:
+        codes = np.array([self._code_of(value) for value in values], dtype=np.uint64)
+        distances = self._unique_distances(metric_codes(self.metrics, codes))
+        return [self._expand(row, k) for row in distances]
+
+    def unique_distance_matrix(self, chunk_size: int = 1024) -> np.ndarray:
+        """
+        All-pairs distances between the distinct codes of the index, for clustering jobs. Use unique_codes, inverse
+        and rows_of to go back to the rows.
+        :param chunk_size: Number of distinct codes compared at once
+        :return: np.ndarray of shape (len(unique_codes), len(unique_codes))
+        """
+        size = len(self.unique_codes)
+        matrix = np.empty((size, size))
+        for start in range(0, size, chunk_size):
+            matrix[start:start + chunk_size] = self._unique_distances(self._unique_metrics[start:start + chunk_size])
+        return matrix
+
+    def rows_of(self, unique: int) -> np.ndarray:
+        """
+        Rows whose code is unique_codes[unique], in increasing order.
+        :param unique:
+        :return: np.ndarray
+        """
+        return self._row_order[self._bounds[unique]:self._bounds[unique + 1]]
@@ -0,0 +1,131 @@
+import csv
+import json
+from dataclasses import dataclass
+from typing import Iterator, TextIO
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss, MetricField
+from abs.exceptions import InvalidMetricValueError, InvalidRecordError
+from cvss.corpus import CvssCorpus
+
+
+def load_threat_intel(path: str) -> dict[str, dict[str, str]]:
+    """
+    Read a threat intel file mapping CVE ids to temporal metrics.
+    Either a CSV file with a header like "cve,E,RL,RC" or a JSONL file with lines like {"cve": "...", "E": "F"}.
+    Values are the vector string chars ("F") or the NVD names ("FUNCTIONAL"), an empty value keeps the current one.
+    :param path:
+    :return: dict
+    :raise InvalidRecordError: A record has no cve
+    """
+    intel = {}
+    with open(path, newline='') as f:
+        if path.endswith('.csv'):
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+        for number, row in enumerate(rows, 1):
+            cve = row.pop('cve', None) if isinstance(row, dict) else None
+            if not cve:
+                raise InvalidRecordError(f'Threat intel record {number} of {path} has no cve')
+            intel[cve] = {key: value for key, value in row.items() if value}
+    return intel
+
+
+def _score(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+@dataclass
+class TemporalUpdate:
+    """
+    Rows of a corpus whose scores changed after a threat intel join, with their scores before and after.
+    """
+    corpus: CvssCorpus
+    rows: np.ndarray
+    old_temporal_scores: np.ndarray
+    old_env_scores: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def iter_records(self) -> Iterator[dict]:
+        """
+        A record per changed row, a missing environmental score is None.
+        """
+        corpus = self.corpus
+        for index, row in enumerate(self.rows.tolist()):
+            yield {
+                'id': corpus.ids[row],
+                'vectorString': corpus.get(row).get_vector_string(),
+                'baseScore': float(corpus.base_scores[row]),
+                'oldTemporalScore': float(self.old_temporal_scores[index]),
+                'temporalScore': float(corpus.temporal_scores[row]),
+                'oldEnvScore': _score(self.old_env_scores[index]),
+                'envScore': _score(corpus.env_scores[row])
+            }
+
+    def write_jsonl(self, fp: TextIO) -> None:
+        for record in self.iter_records():
+            fp.write(json.dumps(record) + '\n')
+
+
+def _temporal_layout(cls: type[AbcCvss]) -> dict[str, MetricField]:
+    return {metric.key: metric for metric in cls.metric_layout() if metric.group == 'temporal'}
+
+
+def _resolve_code(metric: MetricField, value: str) -> int:
+    for member in metric.members:
+        if value in (member.value[0], member.value[1]):
+            return metric.code_of(member)
+    raise InvalidMetricValueError(f'Invalid value {value} for metric {metric.name}')
+
+
+def apply_threat_intel(corpus: CvssCorpus, intel: dict[str, dict[str, str]]) -> TemporalUpdate:
+    """
+    Set the temporal metrics of the corpus rows found in intel and compute again their temporal and environmental
+    scores. Only the rows whose metrics really changed are scored, each distinct new vector once.
+    The corpus is updated in place.
+    :param corpus:
+    :param intel: As returned by load_threat_intel
+    :return: TemporalUpdate of the changed rows
+    :raise InvalidRecordError: intel has a column which is not a temporal metric of the corpus class
+    :raise InvalidMetricValueError: intel has an invalid metric value
+    """
+    layout = _temporal_layout(corpus.cls)
+    unknown = sorted({key for values in intel.values() for key in values} - layout.keys())
+    if unknown:
+        raise InvalidRecordError(f'Unknown threat intel columns {unknown} for {corpus.cls.__name__}, expected '
+                                 f'{list(layout)}')
+    resolved: dict[tuple[str, str], int] = {}
+    updates: dict[str, tuple[list[int], list[int]]] = {key: ([], []) for key in layout}
+    for cve, values in intel.items():
+        row = corpus.row_of(cve)
+        if row is None:
+            continue
+        for key, value in values.items():
+            if (key, value) not in resolved:
+                resolved[(key, value)] = _resolve_code(layout[key], value)
+            updates[key][0].append(row)
+            updates[key][1].append(resolved[(key, value)])
+
+    touched = np.unique(np.fromiter((row for rows, _ in updates.values() for row in rows), dtype=np.int64))
+    codes = corpus.codes[touched]
+    for key, (rows, values) in updates.items():
+        if not rows:
+            continue
+        metric = layout[key]
+        positions = np.searchsorted(touched, rows)
+        codes[positions] = ((codes[positions] & ~np.uint64(metric.mask << metric.shift)) |
+                            (np.array(values, dtype=np.uint64) << np.uint64(metric.shift)))
+
+    changed = codes != corpus.codes[touched]
+    rows = touched[changed]
+    update = TemporalUpdate(corpus=corpus,
+                            rows=rows,
+                            old_temporal_scores=corpus.temporal_scores[rows],
+                            old_env_scores=corpus.env_scores[rows])
+    corpus.codes[rows] = codes[changed]
+    corpus.rescore(rows)
+    return update
@@ -0,0 +1,125 @@
+import heapq
+from typing import Hashable, Iterable
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss, CvssVersion
+from cvss.codec import score_codes
+from cvss.corpus import CvssCorpus
+
+SCORES = ('base', 'temporal', 'env')
+
+
+class _Entry:
+    """
+    Heap entry, the smallest entry is the one to drop first: the lowest score, then the highest id.
+    """
+    __slots__ = ('score', 'item_id')
+
+    def __init__(self, score: float, item_id):
+        self.score = score
+        self.item_id = item_id
+
+    def __lt__(self, other: '_Entry') -> bool:
+        if self.score != other.score:
+            return self.score < other.score
+        return self.item_id > other.item_id
+
+
+class TopK:
+    """
+    The k highest scores of every group, with one bounded heap per group.
+    Ties are broken by the smallest id, so the result does not depend on the order of the pushes and partial
+    results computed by several workers can be merged. Rows with a nan score (no environmental score) are ignored.
+    """
+
+    def __init__(self, k: int, score: str = 'env'):
+        if score not in SCORES:
+            raise ValueError(f'score should be one of {SCORES}')
+        self.k = k
+        self.score = score
+        self._heaps: dict[Hashable, list[_Entry]] = {}
+
+    def push(self, group: Hashable, score: float, item_id) -> None:
+        if score != score:
+            return
+        heap = self._heaps.setdefault(group, [])
+        entry = _Entry(float(score), item_id)
+        if len(heap) < self.k:
+            heapq.heappush(heap, entry)
+        elif heap[0] < entry:
+            heapq.heapreplace(heap, entry)
+
+    def push_many(self, groups: Iterable[Hashable], scores: np.ndarray, ids: Iterable) -> None:
+        """
+        Push a batch of rows. Per group, only the rows that can enter the top k are pushed on the heap.
+        :param groups:
+        :param scores:
+        :param ids:
+        :return: None
+        """
+        scores = np.asarray(scores, dtype=float)
+        ids = list(ids)
+        # Groups are numbered in a dict, so that they keep their type (int, str, tuple, None...) as heap keys.
+        labels: dict[Hashable, int] = {}
+        inverse = np.fromiter((labels.setdefault(group, len(labels)) for group in groups), dtype=np.intp,
+                              count=len(scores))
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.searchsorted(inverse[order], np.arange(len(labels) + 1))
+        for index, group in enumerate(labels):
+            rows = order[bounds[index]:bounds[index + 1]]
+            rows = rows[~np.isnan(scores[rows])]
+            heap = self._heaps.get(group)
+            if heap is not None and len(heap) == self.k:
+                rows = rows[scores[rows] >= heap[0].score]
+            if len(rows) > self.k:
+                kth = np.partition(scores[rows], len(rows) - self.k)[len(rows) - self.k]
+                rows = rows[scores[rows] >= kth]
+            for row in rows.tolist():
+                self.push(group, scores[row], ids[row])
+
+    def push_codes(self, groups: Iterable[Hashable], cls: type[AbcCvss], version: CvssVersion,
+                   codes: np.ndarray, ids: Iterable) -> None:
+        """
+        Score packed codes, see AbcCvss.to_packed, and push them in the same pass.
+        """
+        self.push_many(groups, score_codes(cls, version, codes)[SCORES.index(self.score)], ids)
+
+    def push_corpus(self, groups: Iterable[Hashable], corpus: CvssCorpus) -> None:
+        scores = (corpus.base_scores, corpus.temporal_scores, corpus.env_scores)[SCORES.index(self.score)]
+        self.push_many(groups, scores, corpus.ids)
+
+    def push_objects(self, groups: Iterable[Hashable], objects: Iterable[AbcCvss], ids: Iterable) -> None:
+        getter = {'base': AbcCvss.get_base_score,
+                  'temporal': AbcCvss.get_temporal_score,
+                  'env': AbcCvss.get_env_score}[self.score]
+        for group, cvss, item_id in zip(groups, objects, ids):
+            score = getter(cvss)
+            if score is not None:
+                self.push(group, score, item_id)
+
+    def merge(self, other: 'TopK') -> None:
+        """
+        Add the partial result of other, computed on another part of the stream, to this one.
+        :param other:
+        :return: None
+        """
+        if (other.k, other.score) != (self.k, self.score):
+            raise ValueError('Only TopK with the same k and score can be merged')
+        for group, heap in other._heaps.items():
+            for entry in heap:
+                self.push(group, entry.score, entry.item_id)
+
+    def groups(self) -> list[Hashable]:
+        return list(self._heaps)
+
+    def result(self, group: Hashable) -> list[tuple[float, object]]:
+        """
+        The top k of group as (score, id), highest score first.
+        :param group:
+        :return: list
+        """
+        return [(entry.score, entry.item_id) for entry in sorted(self._heaps.get(group, []), reverse=True)]
+
+    def results(self) -> dict[Hashable, list[tuple[float, object]]]:
+        return {group: self.result(group) for group in self._heaps}
@@ -6,6 +6,7 @@ setup(name='cvss-lib',
       description='A librairy with python class to manipulate CVSS',
       author="Jules PETRY",
       author_email="jules67117@gmail.com",
-      packages=find_packages(exclude=['test']),
+      packages=find_packages(exclude=['test', 'benchmark']),
+      package_data={'cvss': ['data/score_tables.bin']},
       install_requires=["numpy"],
       license="MIT")
\ No newline at end of file
@@ -0,0 +1,63 @@
+import mmap
+
+import numpy as np
+
+from abs.abc_cvss import AbcCvss
+from cvss.buffer_parser import VectorBufferParser
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v31 import CvssV31
+
+LINES = [b"CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H",
+         b"CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H/MAV:P",
+         b"not a vector",
+         b"CVSS:3.0/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H"]
+
+
+def run():
+    test_parse_vector_string_bytes()
+    test_parse_buffer()
+    test_hash_collisions()
+    test_score_mmap()
+
+
+def test_parse_vector_string_bytes() -> None:
+    assert AbcCvss.parse_vector_string(memoryview(b"AV:N/AC:L")) == {'AV': 'N', 'AC': 'L'}
+    assert CvssV2.from_vector_string(b"AV:N/AC:L/Au:N/C:N/I:N/A:P").get_base_score() == 5
+
+
+def test_parse_buffer() -> None:
+    parser = VectorBufferParser(CvssV31, chunk_size=64)
+    buffer = bytearray(b"\n".join(LINES * 3) + b"\r\n")
+    parsed = parser.parse_buffer(buffer)
+    assert len(parsed) == 12
+    assert parsed.valid.tolist() == [True, True, False, True] * 3
+    expected = [CvssV31.from_vector_string(line).to_packed() for line in LINES if line != b"not a vector"]
+    assert parsed.codes[[0, 1, 3]].tolist() == expected
+    assert parsed.codes[[8, 9, 11]].tolist() == expected
+    assert parsed.version_tags[3] != parsed.version_tags[0]
+    assert len(parser.parse_buffer(b"")) == 0
+
+
+def test_hash_collisions() -> None:
+    class CollidingParser(VectorBufferParser):
+        def _hashes(self, chunk: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+            return np.zeros(len(starts), dtype=np.uint64)
+
+    buffer = b"\n".join(LINES * 2 + [LINES[0] + b"/E:U"])
+    expected = VectorBufferParser(CvssV31).parse_buffer(buffer)
+    parser = CollidingParser(CvssV31)
+    for _ in range(2):
+        parsed = parser.parse_buffer(buffer)
+        assert parsed.codes.tolist() == expected.codes.tolist()
+        assert parsed.valid.tolist() == expected.valid.tolist()
+    assert len(set(expected.codes.tolist())) == 4
+
+
+def test_score_mmap(tmp_path) -> None:
+    path = tmp_path / 'vectors.txt'
+    path.write_bytes(b"\n".join(LINES) + b"\n")
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        base, temporal, env = VectorBufferParser(CvssV31).score_buffer(buffer)
+    assert base[[0, 1, 3]].tolist() == [7.5, 10.0, 7.5]
+    assert env[1] == 7.7
+    assert np.isnan(base[2])
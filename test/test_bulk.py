@@ -0,0 +1,65 @@
+from abs.exceptions import CvssError, InvalidMetricValueError, InvalidRecordError, InvalidVectorStringError, \
+    InvalidVersionError, MissingMetricError
+from cvss.bulk import ERROR_NAMES, bulk_from_primitive_dicts, bulk_from_vector_strings
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v31 import CvssV31
+from cvss.nvd_writer import nvd_metric
+
+
+def run():
+    test_single_object_errors()
+    test_bulk_from_vector_strings()
+    test_bulk_from_primitive_dicts()
+
+
+def _raises(error: type[CvssError], function, *args) -> None:
+    try:
+        function(*args)
+    except error:
+        return
+    assert False, f'{error.__name__} not raised'
+
+
+def test_single_object_errors() -> None:
+    _raises(InvalidVectorStringError, CvssV2.from_vector_string, "AV:N/AC:L")
+    _raises(InvalidVectorStringError, CvssV31.from_vector_string, "CVSS:3.1/AV")
+    _raises(MissingMetricError, CvssV31.from_vector_string, "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N")
+    _raises(InvalidMetricValueError, CvssV31.from_vector_string, "CVSS:3.1/AV:Z/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H")
+    _raises(InvalidVersionError, CvssV31.from_vector_string, "CVSS:9.9/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H")
+    # Every error is still a ValueError for the callers that caught it before.
+    _raises(ValueError, CvssV31.from_vector_string, b"CVSS:3.1/AV:\xff")
+
+
+def test_bulk_from_vector_strings() -> None:
+    values = ["CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H", "CVSS:3.1/AV:Z/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H",
+              "AV:N/AC:L/Au:N/C:N/I:N/A:P", "CVSS:3.1/AV:Z/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H", "garbage"]
+    result = bulk_from_vector_strings(values)
+    assert len(result) == 5
+    assert result.error_codes.tolist() == [0, InvalidMetricValueError.code, 0, InvalidMetricValueError.code,
+                                           InvalidVersionError.code]
+    assert result.failed_rows().tolist() == [1, 3, 4]
+    assert result.objects[0].get_base_score() == 7.5 and result.objects[2].get_base_score() == 5.0
+    assert result.objects[1] is None and result.message(0) is None
+    assert result.message(1) == result.message(3)
+    assert len(result.messages) == 2
+    assert ERROR_NAMES[result.error_codes[4]] == 'InvalidVersionError'
+
+    result = bulk_from_vector_strings(values, CvssV2)
+    assert result.error_codes.tolist() == [InvalidVectorStringError.code] * 2 + [0] + \
+        [InvalidVectorStringError.code] * 2
+
+    result = bulk_from_vector_strings([['x'], None, 5, bytearray(b"AV:N/AC:L/Au:N/C:N/I:N/A:P")])
+    assert result.error_codes.tolist() == [InvalidRecordError.code, InvalidVectorStringError.code,
+                                           InvalidVectorStringError.code, 0]
+
+
+def test_bulk_from_primitive_dicts() -> None:
+    entry = nvd_metric(CvssV31.from_vector_string("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H"))
+    broken = {'cvssData': {'version': '3.1'}}
+    result = bulk_from_primitive_dicts([[entry], [broken], []], CvssV31)
+    assert result.error_codes.tolist() == [0, InvalidRecordError.code, InvalidRecordError.code]
+    assert result.objects[0] == CvssV31.from_primitive_dict([entry])
+    assert result.message(1).startswith('KeyError')
+
+    result = bulk_from_primitive_dicts([{'cve': 'CVE-1'}, [], [5], {'cvssMetricV31': [broken]}])
+    assert result.error_codes.tolist() == [InvalidRecordError.code] * 4
@@ -0,0 +1,46 @@
+import copy
+import pickle
+
+from abs.abc_cvss import CvssVersion
+from cvss.codec import dumps_batch, loads_batch
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v31 import CvssV31
+
+
+def run():
+    test_packed_round_trip()
+    test_pickle_round_trip()
+    test_batch_round_trip()
+
+
+def test_packed_round_trip() -> None:
+    cvss_v31 = CvssV31.from_vector_string("CVSS:3.1/AV:L/AC:H/PR:L/UI:R/S:U/C:L/I:L/A:N/E:P/RL:O/RC:C/MAV:N")
+    assert CvssV31.from_packed(cvss_v31.to_packed(), CvssVersion.CVSS_V31) == cvss_v31
+    cvss_v2 = CvssV2.from_vector_string("AV:N/AC:M/Au:S/C:C/I:C/A:C/E:F")
+    assert CvssV2.from_packed(cvss_v2.to_packed(), CvssVersion.CVSS_V2) == cvss_v2
+
+
+def test_pickle_round_trip() -> None:
+    cvss = CvssV31.from_vector_string("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H/MAV:P")
+    restored = pickle.loads(pickle.dumps(cvss))
+    assert restored == cvss
+    assert restored.get_env_score() == 7.7
+    assert len(pickle.dumps(cvss)) < len(pickle.dumps((type(cvss), vars(cvss))))
+
+    # Scores set on the object are kept, not computed again from the metrics.
+    cvss.set_base_score(3.0)
+    for restored in (pickle.loads(pickle.dumps(cvss)), copy.deepcopy(cvss)):
+        assert restored.get_base_score() == 3.0
+        assert restored.get_env_score() == 7.7
+        assert restored == cvss
+
+
+def test_batch_round_trip() -> None:
+    objects = [CvssV2.from_vector_string("AV:N/AC:L/Au:N/C:N/I:N/A:P"),
+               CvssV31.from_vector_string("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H"),
+               CvssV31.from_vector_string("CVSS:3.0/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H")]
+    restored = loads_batch(dumps_batch(objects))
+    assert restored == objects
+    assert [type(o) for o in restored] == [CvssV2, CvssV31, CvssV31]
+    assert restored[2].version == CvssVersion.CVSS_V30
+    assert loads_batch(dumps_batch([])) == []
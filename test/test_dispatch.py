@@ -0,0 +1,58 @@
+import math
+
+from abs.abc_cvss import CvssVersion
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v30 import CvssV30
+from cvss.cvss_v31 import CvssV31
+from cvss.dispatch import detect_class, parse_any, parse_many, score_any, score_many
+from cvss.nvd_writer import nvd_metric
+
+
+def run():
+    test_detect_class()
+    test_parse_any_nvd_record()
+    test_score_many_mixed_versions()
+
+
+V2 = "AV:N/AC:L/Au:N/C:N/I:N/A:P"
+V30 = "CVSS:3.0/AV:L/AC:H/PR:L/UI:N/S:C/C:H/I:H/A:H"
+V31 = "CVSS:3.1/AV:L/AC:H/PR:L/UI:N/S:C/C:H/I:H/A:H"
+
+
+def test_detect_class() -> None:
+    assert detect_class(V2) is CvssV2
+    assert detect_class(V30.encode()) is CvssV30
+    assert detect_class(V31) is CvssV31
+    assert parse_any(V30).version == CvssVersion.CVSS_V30
+    # The modified impact of a changed scope is computed with the v3.0 formula.
+    assert parse_any(V30).get_env_score() == parse_any(V30).get_base_score() == 7.8
+    assert parse_any(V31).get_env_score() == 7.9
+    try:
+        detect_class("CVSS:4.0/AV:N")
+    except ValueError:
+        pass
+    else:
+        assert False
+
+
+def test_parse_any_nvd_record() -> None:
+    secondary = nvd_metric(CvssV31.from_vector_string(V31), source='other', metric_type='Secondary')
+    primary = nvd_metric(CvssV31.from_vector_string("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H"))
+    record = {'cve': {'id': 'CVE-1', 'metrics': {'cvssMetricV2': [nvd_metric(CvssV2.from_vector_string(V2))],
+                                                 'cvssMetricV31': [secondary, primary]}}}
+    assert detect_class(record) is CvssV31
+    assert score_any(record) == (7.5, 7.5, 7.5)
+    assert parse_any([nvd_metric(CvssV2.from_vector_string(V2))]) == CvssV2.from_vector_string(V2)
+
+
+def test_score_many_mixed_versions() -> None:
+    values = [V31, V2, V30, V31.encode(), {'cvssMetricV2': [nvd_metric(CvssV2.from_vector_string(V2))]}, V2]
+    objects = parse_many(values)
+    assert [type(cvss) for cvss in objects] == [CvssV31, CvssV2, CvssV30, CvssV31, CvssV2, CvssV2]
+    assert objects[0] is objects[3]
+    base, temporal, env = score_many(values)
+    for row, cvss in enumerate(objects):
+        assert base[row] == cvss.get_base_score()
+        assert temporal[row] == cvss.get_temporal_score()
+        expected_env = cvss.get_env_score()
+        assert math.isnan(env[row]) if expected_env is None else env[row] == expected_env
@@ -0,0 +1,48 @@
+import random
+
+import numpy as np
+
+from abs.abc_cvss import CvssVersion
+from cvss.cvss_v31 import CvssV31
+from cvss.env_profile import EnvironmentalProfile, ProfileCache, compile_profile
+
+
+def run():
+    test_compiled_profile_matches_objects()
+    test_profile_cache()
+
+
+def _random_vector(rng: random.Random, metrics: dict[str, str]) -> str:
+    return '/'.join(f'{key}:{rng.choice(chars)}' for key, chars in metrics.items())
+
+
+def test_compiled_profile_matches_objects() -> None:
+    rng = random.Random(0)
+    base = {'AV': 'NALP', 'AC': 'LH', 'PR': 'NLH', 'UI': 'NR', 'S': 'UC', 'C': 'HLN', 'I': 'HLN', 'A': 'HLN',
+            'E': 'XUPFH', 'RL': 'XOTWU', 'RC': 'XURC'}
+    env = {'MAV': 'XNALP', 'MAC': 'XLH', 'MPR': 'XNLH', 'MUI': 'XNR', 'MS': 'XUC', 'MC': 'XHLN', 'MI': 'XHLN',
+           'MA': 'XHLN', 'CR': 'XLMH', 'IR': 'XLMH', 'AR': 'XLMH'}
+    for _ in range(20):
+        profile_string = _random_vector(rng, env)
+        compiled = compile_profile(CvssV31, CvssVersion.CVSS_V31, EnvironmentalProfile.from_vector_string(
+            profile_string))
+        vectors = [f'CVSS:3.1/{_random_vector(rng, base)}' for _ in range(50)]
+        expected = [CvssV31.from_vector_string(f'{v}/{profile_string}').get_env_score() for v in vectors]
+        objects = [CvssV31.from_vector_string(v) for v in vectors]
+        codes = np.array([cvss.to_packed() for cvss in objects], dtype=np.uint64)
+        assert compiled.score_codes(codes).tolist() == expected
+        assert compiled.score(objects[0]) == expected[0]
+
+
+def test_profile_cache() -> None:
+    cache = ProfileCache(max_size=2)
+    profiles = [EnvironmentalProfile.from_vector_string(v) for v in ('CR:H', 'IR:H', 'AR:H')]
+    first = cache.get(CvssV31, CvssVersion.CVSS_V31, profiles[0])
+    assert cache.get(CvssV31, CvssVersion.CVSS_V31, profiles[0]) is first
+    cache.get(CvssV31, CvssVersion.CVSS_V31, profiles[1])
+    cache.get(CvssV31, CvssVersion.CVSS_V31, profiles[2])
+    assert len(cache) == 2
+    cache.evict(profiles[1])
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
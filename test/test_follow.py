@@ -0,0 +1,94 @@
+import json
+import os
+
+from cvss.follow import LogFollower
+
+V31 = "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H"
+V2 = "AV:N/AC:L/Au:N/C:N/I:N/A:P"
+
+
+def run(tmp_path):
+    test_follow_append_rotation_truncation(tmp_path)
+    test_follow_checkpoint(tmp_path)
+    test_follow_small_reads(tmp_path)
+
+
+def _append(path: str, *lines: str) -> None:
+    with open(path, 'a') as f:
+        f.write(''.join(lines))
+
+
+def _line(cve_id: str, vector: str) -> str:
+    return json.dumps({'id': cve_id, 'vectorString': vector}) + '\n'
+
+
+def test_follow_append_rotation_truncation(tmp_path) -> None:
+    path = str(tmp_path / 'findings.jsonl')
+    _append(path, _line('CVE-1', V31), 'not json\n')
+    with LogFollower([path]) as follower:
+        assert follower.poll() == 2
+        assert follower.aggregates.count == 1 and follower.aggregates.invalid == 1
+        assert follower.poll() == 0
+
+        # A partial line is only read once complete.
+        _append(path, _line('CVE-2', V2), '{"id": "CVE-3", ')
+        assert follower.poll() == 1
+        _append(path, '"vectorString": "' + V31 + '"}\n')
+        assert follower.poll() == 1
+        assert follower.aggregates.severity_counts == {'HIGH': 2, 'MEDIUM': 1}
+        assert follower.aggregates.metric_counts()['AV'] == {'N': 3}
+
+        # Rotation: the end of the old file is read, then the new file from its start.
+        _append(path, _line('CVE-4', V31))
+        os.rename(path, path + '.1')
+        _append(path, _line('CVE-5', V2))
+        assert follower.poll() == 2
+        assert follower.aggregates.count == 5
+
+        # Truncation: the file is read again from its start.
+        open(path, 'w').close()
+        assert follower.poll() == 0
+        _append(path, _line('CVE-6', V31))
+        assert follower.poll() == 1
+        assert follower.aggregates.top_k.result('3.1')[0] == (7.5, 'CVE-1')
+        assert follower.aggregates.count == 6
+
+        # A numeric id ties with string ids in the top k.
+        _append(path, json.dumps({'id': 5, 'vectorString': V31}) + '\n')
+        assert follower.poll() == 1
+        assert (7.5, '5') in follower.aggregates.top_k.result('3.1')
+
+
+def test_follow_checkpoint(tmp_path) -> None:
+    path = str(tmp_path / 'findings.jsonl')
+    checkpoint = str(tmp_path / 'checkpoint')
+    _append(path, _line('CVE-1', V31), _line('CVE-2', V2))
+    with LogFollower([path], checkpoint_path=checkpoint) as follower:
+        follower.poll()
+        follower.checkpoint()
+
+    _append(path, _line('CVE-3', V31))
+    with LogFollower([path], checkpoint_path=checkpoint) as follower:
+        assert follower.poll() == 1
+        assert follower.aggregates.count == 3
+
+        ticks = iter(range(3))
+        follower.follow(interval=0, stop=lambda: next(ticks, None) is None)
+    with LogFollower([path], checkpoint_path=checkpoint) as follower:
+        assert follower.aggregates.count == 3
+        assert follower.poll() == 0
+
+
+def test_follow_small_reads(tmp_path) -> None:
+    path = str(tmp_path / 'findings.jsonl')
+    _append(path, *(_line(f'CVE-{i}', V31 if i % 3 else V2) for i in range(50)), '\n', '{"id": "CVE-50", ')
+    with LogFollower([path]) as expected, LogFollower([path], read_size=7) as follower:
+        assert follower.poll() == expected.poll() == 51
+        assert follower.cursors[path].offset == expected.cursors[path].offset
+        assert follower.aggregates.finalize() == expected.aggregates.finalize()
+        try:
+            follower.checkpoint()
+        except ValueError:
+            pass
+        else:
+            assert False
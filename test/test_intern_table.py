@@ -0,0 +1,36 @@
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v31 import CvssV31
+from cvss.intern_table import VectorInternTable
+
+VECTORS = ["CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H",
+           "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H/MAV:P",
+           "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H"]
+
+
+def run():
+    test_intern_table_encode_decode()
+    test_intern_table_merge()
+
+
+def test_intern_table_encode_decode() -> None:
+    table = VectorInternTable()
+    ids = table.encode_vector_strings(CvssV31, VECTORS)
+    assert ids.tolist() == [0, 1, 0]
+    assert len(table) == 2
+    assert table.intern(CvssV31.from_vector_string(VECTORS[1])) == 1
+    decoded = table.decode(ids)
+    assert decoded[0] is decoded[2]
+    assert decoded[1].get_env_score() == 7.7
+    assert decoded == [CvssV31.from_vector_string(v) for v in VECTORS]
+
+
+def test_intern_table_merge() -> None:
+    left = VectorInternTable()
+    left.encode_vector_strings(CvssV31, VECTORS[:1])
+    right = VectorInternTable()
+    right_ids = right.encode([CvssV2.from_vector_string("AV:N/AC:L/Au:N/C:N/I:N/A:P"),
+                              CvssV31.from_vector_string(VECTORS[0])])
+    remap = left.merge(right)
+    assert remap.tolist() == [1, 0]
+    assert left.decode(remap[right_ids]) == right.decode(right_ids)
+    assert len(left) == 2
@@ -0,0 +1,14 @@
+from benchmark.bench_memory import check_budgets, measure
+
+
+def run():
+    test_memory_budgets()
+    test_memory_budget_violation()
+
+
+def test_memory_budgets() -> None:
+    assert check_budgets(measure(size=1000)) == []
+
+
+def test_memory_budget_violation() -> None:
+    assert check_budgets({'packed numpy': 8.0}, {'packed numpy': 4}) == ['packed numpy: 8.0 bytes/row > 4']
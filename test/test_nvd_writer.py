@@ -0,0 +1,53 @@
+import gzip
+import io
+import json
+
+from cvss.corpus import CvssCorpus
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v31 import CvssV31
+from cvss.nvd_writer import NvdJsonWriter, nvd_vector_string
+
+
+def run():
+    test_nvd_vector_string()
+    test_nvd_writer_round_trip()
+    test_nvd_writer_json_gzip()
+
+
+def test_nvd_vector_string() -> None:
+    assert nvd_vector_string(CvssV31.from_vector_string(
+        "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H/E:X/MPR:L")) == \
+        "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H/MPR:L"
+    assert nvd_vector_string(CvssV2.from_vector_string("AV:N/AC:L/Au:N/C:N/I:N/A:P")) == "AV:N/AC:L/Au:N/C:N/I:N/A:P"
+
+
+def test_nvd_writer_round_trip() -> None:
+    objects = [CvssV31.from_vector_string("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H/MAV:P/E:F"),
+               CvssV2.from_vector_string("AV:N/AC:L/Au:N/C:N/I:N/A:P/RL:OF")]
+    fp = io.StringIO()
+    with NvdJsonWriter(fp, flush_rows=1) as writer:
+        writer.write_many(objects, ['CVE-1', 'CVE-2'])
+    lines = [json.loads(line) for line in fp.getvalue().splitlines()]
+    v31 = lines[0]['cve']['metrics']['cvssMetricV31']
+    assert v31[0]['cvssData']['attackVector'] == 'NETWORK'
+    assert v31[0]['cvssData']['environmentalScore'] == objects[0].get_env_score()
+    assert CvssV31.from_primitive_dict(v31) == objects[0]
+    v2 = lines[1]['cve']['metrics']['cvssMetricV2']
+    assert v2[0]['baseSeverity'] == 'MEDIUM'
+    assert CvssV2.from_primitive_dict(v2) == objects[1]
+    # Sub scores published by the NVD for these base vectors.
+    assert (v31[0]['exploitabilityScore'], v31[0]['impactScore']) == (3.9, 6.0)
+    assert (v2[0]['exploitabilityScore'], v2[0]['impactScore']) == (10.0, 2.9)
+
+
+def test_nvd_writer_json_gzip(tmp_path) -> None:
+    corpus = CvssCorpus.from_vector_strings(CvssV31, ['CVE-1', 'CVE-2'],
+                                            ["CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H"] * 2)
+    path = str(tmp_path / 'feed.json.gz')
+    with NvdJsonWriter(path, fmt='json') as writer:
+        writer.write_corpus(corpus)
+    with gzip.open(path, 'rt') as f:
+        feed = json.load(f)
+    assert feed['totalResults'] == 2
+    assert [v['cve']['id'] for v in feed['vulnerabilities']] == ['CVE-1', 'CVE-2']
+    assert feed['vulnerabilities'][1]['cve']['metrics']['cvssMetricV31'][0]['cvssData']['baseScore'] == 7.5
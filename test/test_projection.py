@@ -0,0 +1,47 @@
+import io
+
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v30 import CvssV30
+from cvss.cvss_v31 import CvssV31
+from cvss.projection import Projection, get_projection
+
+
+def run():
+    test_projection_matches_full_dict()
+    test_projection_batch()
+
+
+def test_projection_matches_full_dict() -> None:
+    for cvss in (CvssV31.from_vector_string("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H/MPR:L/E:F"),
+                 CvssV2.from_vector_string("AV:N/AC:L/Au:N/C:N/I:N/A:P/RL:OF")):
+        full = cvss.to_primitive_dict()
+        assert list(cvss.to_primitive_dict(list(full)).items()) == list(full.items())
+        assert cvss.to_primitive_dict(['baseScore', 'vectorString']) == \
+            {'baseScore': full['baseScore'], 'vectorString': full['vectorString']}
+    assert get_projection(CvssV31, ('baseScore',)) is get_projection(CvssV31, ('baseScore',))
+    try:
+        Projection(CvssV2, ['attackVector'])
+    except ValueError:
+        pass
+    else:
+        assert False
+
+
+def test_projection_batch() -> None:
+    objects = [CvssV31.from_vector_string("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H"),
+               CvssV31.from_vector_string("CVSS:3.1/AV:L/AC:H/PR:L/UI:R/S:U/C:L/I:L/A:N")]
+    projection = Projection(CvssV31, ['baseScore', 'attackVector'])
+    rows = objects + objects[:1]
+    assert projection.tuples(rows) == [(7.5, 'AV:N/'), (3.3, 'AV:L/'), (7.5, 'AV:N/')]
+    assert projection.dicts(rows)[1] == objects[1].to_primitive_dict(projection)
+    for cvss in (CvssV30.from_vector_string("CVSS:3.0/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H"),
+                 CvssV2.from_vector_string("AV:N/AC:L/Au:N/C:N/I:N/A:P")):
+        try:
+            cvss.to_primitive_dict(projection)
+        except ValueError:
+            pass
+        else:
+            assert False
+    fp = io.StringIO()
+    projection.write_rows(rows, fp)
+    assert fp.getvalue().splitlines() == ['baseScore,attackVector', '7.5,AV:N/', '3.3,AV:L/', '7.5,AV:N/']
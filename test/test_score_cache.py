@@ -0,0 +1,101 @@
+import sqlite3
+
+from abs.exceptions import InvalidVectorStringError
+
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v30 import CvssV30
+from cvss.cvss_v31 import CvssV31
+from cvss.score_cache import ScoreCache, cache_key, cache_key_of
+
+VECTORS = ["CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H",
+           "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H/MAV:P",
+           "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H/E:X"]
+
+
+def run():
+    test_cache_key()
+    test_score_cache_read_write_through()
+    test_score_cache_eviction()
+    test_score_cache_classes()
+    test_score_cache_old_schema()
+    test_score_cache_validates_vector_strings()
+
+
+def test_cache_key() -> None:
+    assert cache_key(CvssV31, VECTORS[0]) == cache_key(CvssV31, VECTORS[2])
+    assert cache_key(CvssV31, VECTORS[1]) == cache_key_of(CvssV31.from_vector_string(VECTORS[1]))
+    assert cache_key(CvssV31, VECTORS[1]).profile.startswith('MAV:P/MAC:X/MPR:X')
+    assert cache_key(CvssV2, "AV:N/AC:L/Au:N/C:N/I:N/A:P") == cache_key_of(
+        CvssV2.from_vector_string("AV:N/AC:L/Au:N/C:N/I:N/A:P"))
+    assert cache_key(CvssV31, "CVSS:3.1/AV:N/AC:Z") is None
+
+
+def test_score_cache_read_write_through(tmp_path) -> None:
+    path = str(tmp_path / 'scores.sqlite')
+    with ScoreCache(path) as cache:
+        scores = cache.score_vector_strings(CvssV31, VECTORS)
+        assert [s.base_score for s in scores] == [7.5, 10.0, 7.5]
+        assert scores[1].env_score == 7.7
+        assert len(cache) == 2
+    with ScoreCache(path) as cache:
+        found = cache.get_many([cache_key(CvssV31, v) for v in VECTORS])
+        assert len(found) == 2
+        assert cache.score_vector_strings(CvssV31, VECTORS) == scores
+
+
+def test_score_cache_eviction(tmp_path) -> None:
+    with ScoreCache(str(tmp_path / 'scores.sqlite'), max_entries=1) as cache:
+        cache.score_vector_strings(CvssV31, VECTORS[:1])
+        cache.score_vector_strings(CvssV31, VECTORS[1:2])
+        assert len(cache) == 1
+        assert list(cache.get_many([cache_key(CvssV31, VECTORS[1])]).values())[0].env_score == 7.7
+    with ScoreCache(str(tmp_path / 'lru.sqlite'), max_entries=10) as cache:
+        vectors = [f"CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H/{metric}" for metric in
+                   ("MAV:N", "MAV:A", "MAV:L", "MAV:P", "MAC:L", "MAC:H", "MPR:N", "MPR:L", "MPR:H", "MUI:N")]
+        cache.score_vector_strings(CvssV31, vectors)
+        changes = cache._connection.total_changes
+        assert len(cache.get_many([cache_key(CvssV31, vectors[0])])) == 1
+        assert cache._connection.total_changes == changes
+        cache.score_vector_strings(CvssV31, ["CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H/MUI:R"])
+        # Evicted down to 9 entries, the entry read last is kept.
+        assert len(cache) == 9
+        assert len(cache.get_many([cache_key(CvssV31, vector) for vector in vectors])) == 8
+        assert len(cache.get_many([cache_key(CvssV31, vectors[0])])) == 1
+
+
+def test_score_cache_classes(tmp_path) -> None:
+    vector = "CVSS:3.0/AV:L/AC:H/PR:L/UI:N/S:C/C:H/I:H/A:H/MAV:L"
+    assert cache_key(CvssV30, vector) != cache_key(CvssV31, vector)
+    with ScoreCache(str(tmp_path / 'scores.sqlite')) as cache:
+        v31 = cache.score_vector_strings(CvssV31, [vector])[0]
+        v30 = cache.score_vector_strings(CvssV30, [vector])[0]
+        assert (v30.env_score, v31.env_score) == (CvssV30.from_vector_string(vector).get_env_score(),
+                                                  CvssV31.from_vector_string(vector).get_env_score())
+        assert v30.env_score != v31.env_score
+
+
+def test_score_cache_old_schema(tmp_path) -> None:
+    path = str(tmp_path / 'scores.sqlite')
+    with sqlite3.connect(path) as connection:
+        connection.execute('CREATE TABLE scores (version TEXT, vector TEXT, profile TEXT, base_score REAL, '
+                           'temporal_score REAL, env_score REAL, severity TEXT, last_used INTEGER)')
+        connection.execute("INSERT INTO scores VALUES ('3.1', 'AV:N', '', 1.0, 1.0, 1.0, 'LOW', 0)")
+    connection.close()
+    with ScoreCache(path) as cache:
+        assert len(cache) == 0
+        assert cache.score_vector_strings(CvssV31, VECTORS[:1])[0].base_score == 7.5
+
+
+def test_score_cache_validates_vector_strings(tmp_path) -> None:
+    reordered = "AC:L/AV:N/Au:N/C:N/I:N/A:P"
+    assert cache_key(CvssV2, reordered) is None
+    for warm in (False, True):
+        with ScoreCache(str(tmp_path / f'scores-{warm}.sqlite')) as cache:
+            if warm:
+                assert cache.score_vector_strings(CvssV2, ["AV:N/AC:L/Au:N/C:N/I:N/A:P"])[0].base_score == 5.0
+            try:
+                cache.score_vector_strings(CvssV2, [reordered])
+            except InvalidVectorStringError:
+                pass
+            else:
+                assert False
@@ -0,0 +1,38 @@
+from abs.abc_cvss import CvssSeverity, CvssVersion
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v3 import AttackVector, PrivilegesRequired
+from cvss.cvss_v31 import CvssV31
+from cvss.score_index import get_score_index
+
+
+def run():
+    test_score_index_by_score()
+    test_score_index_nearest_below()
+
+
+def test_score_index_by_score() -> None:
+    index = get_score_index(CvssV31, CvssVersion.CVSS_V31)
+    assert len(index) == 4 * 2 * 3 * 2 * 2 * 3 * 3 * 3
+    critical = index.to_objects(index.with_score(9.8))
+    assert critical
+    assert all(cvss.get_base_score() == 9.8 for cvss in critical)
+    assert CvssV31.from_vector_string("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H") in critical
+    assert all(cvss.get_base_severity() == CvssSeverity.NONE
+               for cvss in index.to_objects(index.with_severity(CvssSeverity.NONE)))
+
+    index_v2 = get_score_index(CvssV2, CvssVersion.CVSS_V2)
+    assert len(index_v2) == 3 ** 6
+    assert len(index_v2.with_score(10.0)) == 1
+
+
+def test_score_index_nearest_below() -> None:
+    index = get_score_index(CvssV31, CvssVersion.CVSS_V31)
+    cvss = CvssV31.from_vector_string("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H/E:P")
+    nearest = index.to_objects(index.nearest_below(cvss, 7.0, allowed=['attack_vector', 'privileges_required']),
+                               template=cvss)
+    assert nearest
+    assert all(n.get_base_score() < 7.0 for n in nearest)
+    assert nearest[0].attack_vector == AttackVector.PHYSICAL
+    assert nearest[0].privileges_required == PrivilegesRequired.NONE
+    assert nearest[0].exploit_code_maturity == cvss.exploit_code_maturity
+    assert len(index.nearest_below(cvss, 7.0, allowed=['attack_vector', 'privileges_required'], max_changes=0)) == 0
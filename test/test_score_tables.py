@@ -0,0 +1,105 @@
+import json
+import random
+import struct
+
+import numpy as np
+
+from cvss.score_tables import ARTIFACT_PATH, MAGIC, TABLE_KINDS, _load_tables, build_table, fingerprint, \
+    get_score_table, read_tables, write_tables
+
+
+def run(tmp_path):
+    test_shipped_artifact_is_fresh()
+    test_tables_match_objects()
+    test_corrupted_artifact(tmp_path)
+    test_fingerprint_tracks_code()
+
+
+def test_shipped_artifact_is_fresh() -> None:
+    # Fails when a score formula changed, run "python -m cvss.score_tables" to build the artifact again.
+    tables = read_tables(ARTIFACT_PATH)
+    for cls, version in TABLE_KINDS:
+        table = tables[(f'{cls.__module__}.{cls.__qualname__}', version)]
+        expected = build_table(cls, version)
+        assert np.array_equal(table.base_tenths, expected.base_tenths)
+        assert np.array_equal(table.temporal_tenths, expected.temporal_tenths)
+
+
+def test_tables_match_objects() -> None:
+    rng = random.Random(0)
+    for cls, version in TABLE_KINDS:
+        table = get_score_table(cls, version)
+        layout = cls.metric_layout()
+        codes = np.array([sum(rng.randrange(len(metric.members)) << metric.shift for metric in layout)
+                          for _ in range(200)], dtype=np.uint64)
+        objects = [cls.from_packed(code, version) for code in codes.tolist()]
+        assert table.base_scores(codes).tolist() == [cvss.get_base_score() for cvss in objects]
+        assert table.temporal_scores(codes).tolist() == [cvss.get_temporal_score() for cvss in objects]
+
+
+def test_corrupted_artifact(tmp_path) -> None:
+    path = str(tmp_path / 'score_tables.bin')
+    cls, version = TABLE_KINDS[-1]
+    write_tables(path, [build_table(cls, version)])
+    assert len(read_tables(path)) == 1
+    with open(path, 'r+b') as f:
+        f.seek(-1, 2)
+        f.write(b'\xff')
+    try:
+        read_tables(path)
+    except ValueError:
+        pass
+    else:
+        assert False
+
+    for data in (b'', MAGIC, MAGIC + b'\x01',
+                 MAGIC + struct.pack('<I', 2) + b'{}',
+                 MAGIC + struct.pack('<I', 13) + json.dumps({'format': 1}).encode()):
+        with open(path, 'wb') as f:
+            f.write(data)
+        assert _load_tables(path) == {}
+
+
+def test_fingerprint_tracks_code() -> None:
+    cls, version = TABLE_KINDS[-1]
+
+    def same(self) -> float:
+        """
+        Same code as the method of cls, another source.
+        """
+        attack_vector: float = self.attack_vector.to_float()
+        attack_complexity: float = self.attack_complexity.to_float()
+        priv_required: float = self.privileges_required.to_float(self.scope)
+        user_interaction: float = self.user_interaction.to_float()
+
+        return 8.22 * attack_vector * attack_complexity * priv_required * user_interaction
+
+    def changed_constant(self) -> float:
+        attack_vector: float = self.attack_vector.to_float()
+        attack_complexity: float = self.attack_complexity.to_float()
+        priv_required: float = self.privileges_required.to_float(self.scope)
+        user_interaction: float = self.user_interaction.to_float()
+        return 8.25 * attack_vector * attack_complexity * priv_required * user_interaction
+
+    def changed_operator(self) -> float:
+        attack_vector: float = self.attack_vector.to_float()
+        attack_complexity: float = self.attack_complexity.to_float()
+        priv_required: float = self.privileges_required.to_float(self.scope)
+        user_interaction: float = self.user_interaction.to_float()
+        return 8.22 + attack_vector * attack_complexity * priv_required * user_interaction
+
+    def changed_name(self) -> float:
+        attack_vector: float = self.attack_vector.to_float()
+        attack_complexity: float = self.attack_complexity.to_float()
+        priv_required: float = self.privileges_required.to_float(self.scope)
+        user_interaction: float = self.user_interaction.to_float()
+        return min(8.22 * attack_vector * attack_complexity * priv_required * user_interaction, 10)
+
+    def variant(method) -> type:
+        return type(cls.__name__, (cls,), {'__module__': cls.__module__, '__qualname__': cls.__qualname__,
+                                           '_compute_exploitability_score': method})
+
+    expected = fingerprint(((cls, version),))
+    assert fingerprint(((variant(same), version),)) == expected
+    for method in (changed_constant, changed_operator, changed_name):
+        assert fingerprint(((variant(method), version),)) != expected
@@ -0,0 +1,59 @@
+import random
+
+import numpy as np
+
+from abs.abc_cvss import CvssVersion
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v3 import AttackVector, PrivilegesRequired
+from cvss.cvss_v31 import CvssV31
+from cvss.sensitivity import metric_sensitivity, sensitivity_of
+
+
+def run():
+    test_sensitivity_v31()
+    test_sensitivity_v2()
+    test_sensitivity_matches_objects()
+
+
+def test_sensitivity_v31() -> None:
+    vectors = ["CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H",
+               "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H/MAV:P",
+               "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H"]
+    objects = [CvssV31.from_vector_string(v) for v in vectors]
+    result = sensitivity_of(objects)
+    assert result.base_deltas.shape == (3, 4 + 2 + 3 + 2 + 2 + 3 + 3 + 3)
+    av_local = result.column('attack_vector', AttackVector.LOCAL)
+    assert result.base_deltas[0, av_local] == CvssV31.from_vector_string(
+        "CVSS:3.1/AV:L/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H").get_base_score() - 9.8
+    assert result.base_deltas[0, result.column('attack_vector', AttackVector.NETWORK)] == 0
+    pr_low = result.column('privileges_required', PrivilegesRequired.LOW)
+    assert result.env_deltas[1, pr_low] == CvssV31.from_vector_string(
+        "CVSS:3.1/AV:N/AC:L/PR:L/UI:N/S:C/C:H/I:H/A:H/MAV:P").get_env_score() - objects[1].get_env_score()
+    assert np.array_equal(result.base_deltas[0], result.base_deltas[2])
+
+
+def test_sensitivity_v2() -> None:
+    result = sensitivity_of([CvssV2.from_vector_string("AV:N/AC:L/Au:N/C:C/I:C/A:C")])
+    assert result.base_deltas.shape == (1, 18)
+    assert result.base_deltas.max() == 0
+    assert np.isnan(result.env_deltas).all()
+
+
+def test_sensitivity_matches_objects() -> None:
+    rng = random.Random(0)
+    layout = CvssV31.metric_layout()
+    # Two environmental profiles, the neighbours of the first one are enough to be scored with its compiled profile.
+    profiles = [0, sum(rng.randrange(len(metric.members)) << metric.shift for metric in layout
+                       if metric.group == 'environmental')]
+    codes = [sum(rng.randrange(len(metric.members)) << metric.shift for metric in layout
+                 if metric.group != 'environmental') | profiles[row % 10 == 0] for row in range(200)]
+    version = CvssVersion.CVSS_V31
+    result = metric_sensitivity(CvssV31, version, codes)
+    for row in rng.sample(range(len(codes)), 20):
+        cvss = CvssV31.from_packed(codes[row], version)
+        for column, (name, member) in enumerate(result.alternatives):
+            neighbour = CvssV31.from_packed(codes[row], version)
+            setattr(neighbour, name, member)
+            neighbour = CvssV31.from_packed(neighbour.to_packed(), version)
+            assert result.base_deltas[row, column] == neighbour.get_base_score() - cvss.get_base_score()
+            assert result.env_deltas[row, column] == neighbour.get_env_score() - cvss.get_env_score()
@@ -0,0 +1,134 @@
+import asyncio
+import json
+
+from cvss.server import MicroBatcher, Overloaded, ScoringEngine, ScoringServer
+
+
+def run():
+    test_server_keep_alive()
+    test_server_content_length()
+    test_micro_batcher_back_pressure()
+    test_server_overload_rejects_whole_request()
+    test_micro_batcher_survives_failing_batch()
+
+
+async def _request(reader, writer, method: str, path: str, body: dict | list | str | None = None) -> tuple[int, dict]:
+    data = json.dumps(body).encode() if body is not None else b''
+    writer.write(f'{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(data)}\r\n\r\n'.encode() + data)
+    await writer.drain()
+    head = (await reader.readuntil(b'\r\n\r\n')).decode()
+    length = int(head.lower().split('content-length:')[1].split('\r\n')[0])
+    return int(head.split(' ')[1]), json.loads(await reader.readexactly(length))
+
+
+def test_server_keep_alive() -> None:
+    async def scenario():
+        server = ScoringServer(port=0, max_wait=0.001)
+        await server.start()
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+        status, result = await _request(reader, writer, 'POST', '/score',
+                                        {'vector': "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H"})
+        assert status == 200
+        assert result['baseScore'] == 7.5
+        assert result['baseSeverity'] == 'HIGH'
+        status, results = await _request(reader, writer, 'POST', '/score',
+                                         {'vectors': ["AV:N/AC:L/Au:N/C:N/I:N/A:P", "AV:Z"]})
+        assert status == 200
+        assert results[0]['baseScore'] == 5
+        assert 'error' in results[1]
+        for body in ({'vector': 5}, {'vector': None}, {'vectors': ["AV:N/AC:L/Au:N/C:N/I:N/A:P", ["AV:N"]]},
+                     {'vectors': "AV:N/AC:L/Au:N/C:N/I:N/A:P"}, {'vectors': {"AV:N/AC:L/Au:N/C:N/I:N/A:P": 1}},
+                     ["vector"], "vector", {}):
+            status, result = await _request(reader, writer, 'POST', '/score', body)
+            assert status == 400 and 'error' in result
+        assert await _request(reader, writer, 'GET', '/health') == (200, {'status': 'ok'})
+        status, metrics = await _request(reader, writer, 'GET', '/metrics')
+        assert metrics['vectors'] == 3
+        writer.close()
+        await server.stop()
+
+    asyncio.run(scenario())
+
+
+def test_server_content_length() -> None:
+    async def scenario():
+        server = ScoringServer(port=0, max_wait=0.001, max_body_size=64)
+        await server.start()
+        for length, status in (('abc', 400), ('-1', 400), ('65', 413)):
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            writer.write(f'POST /score HTTP/1.1\r\nHost: localhost\r\nContent-Length: {length}\r\n\r\n'.encode())
+            await writer.drain()
+            head = (await reader.readuntil(b'\r\n\r\n')).decode()
+            assert int(head.split(' ')[1]) == status
+            assert 'connection: close' in head.lower()
+            await reader.read()
+            writer.close()
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+        status, result = await _request(reader, writer, 'POST', '/score', {'vector': "AV:N/AC:L/Au:N/C:N/I:N/A:P"})
+        assert status == 200 and result['baseScore'] == 5
+        writer.close()
+        await server.stop()
+
+    asyncio.run(scenario())
+
+
+def test_micro_batcher_back_pressure() -> None:
+    async def scenario():
+        batcher = MicroBatcher(ScoringEngine(), max_batch_size=2, max_pending=2)
+        first = batcher.submit("AV:N/AC:L/Au:N/C:N/I:N/A:P")
+        batcher.submit("AV:N/AC:L/Au:N/C:N/I:N/A:P")
+        try:
+            batcher.submit("AV:N/AC:L/Au:N/C:N/I:N/A:P")
+            assert False
+        except Overloaded:
+            pass
+        batcher.start()
+        assert (await first)['baseScore'] == 5
+        assert batcher.batches == 1
+        batcher.submit("AV:N/AC:L/Au:N/C:N/I:N/A:P")
+        try:
+            batcher.submit_many(["AV:N/AC:L/Au:N/C:N/I:N/A:P"] * 2)
+            assert False
+        except Overloaded:
+            pass
+        assert batcher.pending == 1
+        await batcher.stop()
+
+    asyncio.run(scenario())
+
+
+def test_server_overload_rejects_whole_request() -> None:
+    async def scenario():
+        server = ScoringServer(port=0, max_batch_size=2, max_pending=2)
+        await server.start()
+        await server.batcher.stop()
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+        status, result = await _request(reader, writer, 'POST', '/score',
+                                        {'vectors': ["AV:N/AC:L/Au:N/C:N/I:N/A:P"] * 3})
+        assert status == 503 and 'error' in result
+        assert server.batcher.pending == 0
+        writer.close()
+        await server.stop()
+
+    asyncio.run(scenario())
+
+
+def test_micro_batcher_survives_failing_batch() -> None:
+    class FailingEngine(ScoringEngine):
+        def score(self, vector_strings: list[str]) -> list[dict]:
+            if 'fail' in vector_strings:
+                raise RuntimeError('fail')
+            return super().score(vector_strings)
+
+    async def scenario():
+        batcher = MicroBatcher(FailingEngine(), max_batch_size=1)
+        batcher.start()
+        try:
+            await batcher.submit('fail')
+            assert False
+        except RuntimeError:
+            pass
+        assert (await batcher.submit("AV:N/AC:L/Au:N/C:N/I:N/A:P"))['baseScore'] == 5
+        await batcher.stop()
+
+    asyncio.run(scenario())
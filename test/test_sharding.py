@@ -0,0 +1,83 @@
+import json
+import multiprocessing
+import random
+
+from cvss.cvss_v31 import CvssV31
+from cvss.sharding import load_partial, merge_partials, partition_files, process_records, process_shard, \
+    read_records, run_sharded, save_partial, shard_files, shard_of
+
+
+def run(tmp_path):
+    test_shard_of()
+    test_sharded_run_matches_single_process(tmp_path)
+    test_malformed_records(tmp_path)
+
+
+def _write_inputs(tmp_path) -> list[str]:
+    rng = random.Random(0)
+    vectors = ["CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H",
+               "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H/MAV:P",
+               "CVSS:3.1/AV:L/AC:H/PR:L/UI:R/S:U/C:L/I:L/A:N/E:P",
+               "CVSS:3.0/AV:P/AC:H/PR:H/UI:R/S:U/C:N/I:N/A:N",
+               "not a vector"]
+    paths = []
+    for index in range(3):
+        path = str(tmp_path / f'input-{index}.jsonl')
+        with open(path, 'w') as f:
+            for _ in range(300):
+                record = {'id': f'CVE-2024-{rng.randrange(600):05}', 'vectorString': rng.choice(vectors)}
+                f.write(json.dumps(record) + '\n')
+        paths.append(path)
+    return paths
+
+
+def test_shard_of() -> None:
+    assert shard_of('CVE-2024-00001', 8) == shard_of('CVE-2024-00001', 8)
+    assert {shard_of(f'CVE-2024-{i:05}', 8) for i in range(100)} == set(range(8))
+
+
+def test_sharded_run_matches_single_process(tmp_path) -> None:
+    paths = _write_inputs(tmp_path)
+    reference = process_records(CvssV31, (r for path in paths for r in read_records(path)), k=5).finalize()
+    assert reference['invalid'] > 0
+    assert sum(reference['severityCounts'].values()) == reference['count']
+
+    for shard_count in (1, 4, 7):
+        result = run_sharded(CvssV31, paths, shard_count, str(tmp_path / f'shards-{shard_count}'), workers=2, k=5)
+        assert result == reference
+    # Spawned workers share no state with this process: classes, records and partial results go through pickle.
+    assert run_sharded(CvssV31, paths, 3, str(tmp_path / 'shards-spawn'), workers=3, k=5,
+                       mp_context=multiprocessing.get_context('spawn')) == reference
+
+    # A small buffer appends to the shard files many times, with the same records in the same order.
+    buffered = partition_files(paths, 7, str(tmp_path / 'buffered'), buffer_size=100)
+    for directory, expected in zip(buffered, partition_files(paths, 7, str(tmp_path / 'unbuffered'))):
+        assert [list(read_records(path)) for path in shard_files(directory)] == \
+            [list(read_records(path)) for path in shard_files(expected)]
+
+    # File based handoff: the partial results of every shard are written, then merged elsewhere.
+    directories = partition_files(paths, 3, str(tmp_path / 'handoff'))
+    files = []
+    for shard, directory in enumerate(directories):
+        files.append(str(tmp_path / f'partial-{shard}.pickle'))
+        save_partial(process_shard(CvssV31, directory, k=5), files[-1])
+    assert merge_partials(load_partial(path) for path in reversed(files)).finalize() == reference
+
+
+def test_malformed_records(tmp_path) -> None:
+    vector = "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H"
+    jsonl = str(tmp_path / 'malformed.jsonl')
+    with open(jsonl, 'w') as f:
+        for record in ({'id': 'CVE-1', 'vectorString': vector}, {'vectorString': vector}, {'id': 'CVE-2'},
+                       {'id': 5, 'vectorString': vector}, ['CVE-3', vector]):
+            f.write(json.dumps(record) + '\n')
+    csv_path = str(tmp_path / 'malformed.csv')
+    with open(csv_path, 'w') as f:
+        f.write(f'id,vectorString\nCVE-4,{vector}\nCVE-5\n')
+    assert list(read_records(jsonl)) == [('CVE-1', vector), (None, vector), ('CVE-2', None), ('5', vector),
+                                         (None, None)]
+    assert list(read_records(csv_path)) == [('CVE-4', vector), ('CVE-5', None)]
+
+    result = process_records(CvssV31, (r for path in (jsonl, csv_path) for r in read_records(path))).finalize()
+    assert (result['count'], result['invalid']) == (3, 4)
+    assert run_sharded(CvssV31, [jsonl, csv_path], 3, str(tmp_path / 'shards'), workers=1) == result
@@ -0,0 +1,66 @@
+import random
+
+import numpy as np
+
+from cvss.cvss_v31 import CvssV31
+from cvss.similarity import SimilarityIndex
+
+
+def run():
+    test_similarity_matches_brute_force()
+    test_unique_distance_matrix()
+
+
+def _random_codes(size: int) -> np.ndarray:
+    rng = random.Random(0)
+    base = [metric for metric in CvssV31.metric_layout() if metric.is_base]
+    # Few distinct values per metric, so that many rows share a code and many distances are tied.
+    return np.array([sum(rng.randrange(min(2, len(metric.members))) << metric.shift for metric in base)
+                     for _ in range(size)], dtype=np.uint64)
+
+
+def _brute_force(cls, codes: np.ndarray, query: int, weights: dict, distance: str, k: int):
+    base = [metric for metric in cls.metric_layout() if metric.is_base]
+
+    def member(code: int, metric):
+        return metric.members[(code >> metric.shift) & metric.mask]
+
+    def value(code: int, metric) -> float:
+        return member(code, metric).value[2]
+
+    rows = []
+    for row, code in enumerate(codes.tolist()):
+        if distance == 'hamming':
+            d = sum(weights.get(m.name, 1.0) for m in base if member(code, m) is not member(query, m))
+        else:
+            d = sum(weights.get(m.name, 1.0) * abs(value(code, m) - value(query, m)) for m in base)
+        rows.append((d, row))
+    return sorted(rows)[:k]
+
+
+def test_similarity_matches_brute_force() -> None:
+    codes = _random_codes(500)
+    query = CvssV31.from_vector_string("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H")
+    for distance, weights in (('hamming', {}), ('hamming', {'attack_vector': 3.0}), ('score', {'scope': 0.5})):
+        index = SimilarityIndex(CvssV31, codes, weights=weights, distance=distance)
+        rows, distances = index.query(query, k=25)
+        expected = _brute_force(CvssV31, codes, query.to_packed(), weights, distance, 25)
+        assert rows.tolist() == [row for _, row in expected]
+        assert np.allclose(distances, [d for d, _ in expected])
+        assert index.distance(query, int(codes[rows[0]])) == distances[0]
+        # Far more rows share each code than k.
+        index = SimilarityIndex(CvssV31, np.tile(codes, 40), weights=weights, distance=distance)
+        rows, distances = index.query(query, k=25)
+        expected = _brute_force(CvssV31, np.tile(codes, 40), query.to_packed(), weights, distance, 25)
+        assert rows.tolist() == [row for _, row in expected]
+
+
+def test_unique_distance_matrix() -> None:
+    codes = _random_codes(300)
+    index = SimilarityIndex(CvssV31, codes, metrics=['attack_vector', 'scope'])
+    matrix = index.unique_distance_matrix(chunk_size=2)
+    assert matrix.shape == (len(index.unique_codes),) * 2
+    assert np.array_equal(matrix, matrix.T) and not matrix.diagonal().any()
+    for unique in range(len(index.unique_codes)):
+        assert (index.inverse[index.rows_of(unique)] == unique).all()
+    assert sum(len(index.rows_of(unique)) for unique in range(len(index.unique_codes))) == len(codes)
@@ -0,0 +1,76 @@
+import io
+import json
+
+from abs.exceptions import InvalidMetricValueError, InvalidRecordError
+from cvss.corpus import CvssCorpus
+from cvss.cvss_v2 import CvssV2
+from cvss.cvss_v31 import CvssV31
+from cvss.threat_intel import apply_threat_intel, load_threat_intel
+
+
+def run():
+    test_temporal_score()
+    test_load_threat_intel()
+    test_apply_threat_intel()
+    test_apply_threat_intel_errors()
+
+
+def test_temporal_score() -> None:
+    assert CvssV2.from_vector_string("AV:N/AC:M/Au:S/C:C/I:C/A:C/E:F/RL:OF/RC:UC").get_temporal_score() == 6.3
+    assert CvssV31.from_vector_string(
+        "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H/E:P/RL:O/RC:C").get_temporal_score() == 8.8
+
+
+def test_load_threat_intel(tmp_path) -> None:
+    path = tmp_path / 'intel.csv'
+    path.write_text("cve,E,RL,RC\nCVE-1,F,,\nCVE-2,HIGH,O,C\n")
+    assert load_threat_intel(str(path)) == {'CVE-1': {'E': 'F'}, 'CVE-2': {'E': 'HIGH', 'RL': 'O', 'RC': 'C'}}
+    path = tmp_path / 'intel.jsonl'
+    path.write_text(json.dumps({'cve': 'CVE-1', 'E': 'F'}) + '\n')
+    assert load_threat_intel(str(path)) == {'CVE-1': {'E': 'F'}}
+    for name, text in (('missing.jsonl', json.dumps({'cve': 'CVE-1'}) + '\n' + json.dumps({'E': 'F'}) + '\n'),
+                       ('empty.csv', "cve,E\nCVE-1,F\n,H\n")):
+        path = tmp_path / name
+        path.write_text(text)
+        try:
+            load_threat_intel(str(path))
+        except InvalidRecordError as e:
+            assert 'record 2' in str(e)
+        else:
+            assert False
+
+
+def test_apply_threat_intel() -> None:
+    corpus = CvssCorpus.from_vector_strings(CvssV31, ['CVE-1', 'CVE-2', 'CVE-3'],
+                                            ["CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H"] * 2 +
+                                            ["CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H/E:H"])
+    update = apply_threat_intel(corpus, {'CVE-1': {'E': 'P', 'RL': 'O'},
+                                         'CVE-3': {'E': 'HIGH'},
+                                         'CVE-9': {'E': 'U'}})
+    assert update.rows.tolist() == [0]
+    assert corpus.temporal_scores.tolist() == [8.8, 9.8, 9.8]
+    assert corpus.get(0) == CvssV31.from_vector_string("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H/E:P/RL:O")
+    fp = io.StringIO()
+    update.write_jsonl(fp)
+    record = json.loads(fp.getvalue())
+    assert record['id'] == 'CVE-1'
+    assert record['oldTemporalScore'] == 9.8
+    assert record['temporalScore'] == 8.8
+
+
+def test_apply_threat_intel_errors() -> None:
+    corpus = CvssCorpus.from_vector_strings(CvssV2, ['CVE-1'], ["AV:N/AC:M/Au:S/C:C/I:C/A:C"])
+    for intel, error in (({'CVE-9': {'E': 'F', 'Exploit': 'F'}}, InvalidRecordError),
+                         ({'CVE-1': {'E': 'Z'}}, InvalidMetricValueError)):
+        try:
+            apply_threat_intel(corpus, intel)
+        except error as e:
+            assert 'Exploit' in str(e) or error is InvalidMetricValueError
+        else:
+            assert False
+    update = apply_threat_intel(corpus, {'CVE-1': {'E': 'F'}})
+    fp = io.StringIO()
+    update.write_jsonl(fp)
+    assert 'NaN' not in fp.getvalue()
+    record = json.loads(fp.getvalue())
+    assert record['envScore'] is None and record['oldEnvScore'] is None
@@ -0,0 +1,48 @@
+import random
+
+import numpy as np
+
+from abs.abc_cvss import CvssVersion
+from cvss.cvss_v31 import CvssV31
+from cvss.top_k import TopK
+
+
+def run():
+    test_top_k_ties_and_merge()
+    test_top_k_codes()
+
+
+def test_top_k_ties_and_merge() -> None:
+    rng = random.Random(0)
+    rows = [(rng.choice('ab'), rng.choice([5.0, 7.5, 9.8]), f'CVE-{i:03}') for i in range(200)]
+    expected = {group: sorted(((s, i) for g, s, i in rows if g == group), key=lambda r: (-r[0], r[1]))[:5]
+                for group in 'ab'}
+
+    single = TopK(5, 'base')
+    single.push_many([g for g, _, _ in rows], np.array([s for _, s, _ in rows]), [i for _, _, i in rows])
+    assert single.results() == expected
+
+    parts = [TopK(5, 'base') for _ in range(3)]
+    for index, (group, score, item_id) in enumerate(reversed(rows)):
+        parts[index % 3].push(group, score, item_id)
+    merged = TopK(5, 'base')
+    for part in parts:
+        merged.merge(part)
+    assert merged.results() == expected
+
+    # Groups keep their original hashable value, whatever their type.
+    groups = [1, (1, 'a'), None, 1, '1', (1, 'a')]
+    mixed = TopK(5, 'base')
+    mixed.push_many(groups, np.arange(6, dtype=float), [f'CVE-{i}' for i in range(6)])
+    assert mixed.results() == {1: [(3.0, 'CVE-3'), (0.0, 'CVE-0')], (1, 'a'): [(5.0, 'CVE-5'), (1.0, 'CVE-1')],
+                               None: [(2.0, 'CVE-2')], '1': [(4.0, 'CVE-4')]}
+
+
+def test_top_k_codes() -> None:
+    vectors = ["CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:H",
+               "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H/MAV:P",
+               "CVSS:3.1/AV:L/AC:H/PR:L/UI:R/S:U/C:L/I:L/A:N"]
+    codes = np.array([CvssV31.from_vector_string(v).to_packed() for v in vectors], dtype=np.uint64)
+    top = TopK(2, 'env')
+    top.push_codes(['asset'] * 3, CvssV31, CvssVersion.CVSS_V31, codes, ['CVE-1', 'CVE-2', 'CVE-3'])
+    assert top.result('asset') == [(7.7, 'CVE-2'), (7.5, 'CVE-1')]